@@ -14,16 +14,27 @@ Run with: uvicorn api:app --reload
 
 from __future__ import annotations
 
-from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+import orjson
+from pydantic import BaseModel, model_validator
 from typing import Any, Optional
 import aiohttp
 import asyncio
-from collections import defaultdict
+import bisect
+import numpy as np
+from cachetools import TTLCache
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta, timezone
-from fuzzywuzzy import fuzz
+from operator import itemgetter
+from rapidfuzz import fuzz, process
+from yarl import URL
+import functools
+import logging
 import os
+import sys
+from types import MappingProxyType
 import hashlib
 import hmac
 import time
@@ -39,33 +50,43 @@ from automation import (
 
 load_dotenv()
 
+# Fetchers log through here instead of print(): under concurrent fan-out,
+# print serializes coroutines on the stdout lock and a write() syscall per
+# line, and %-style args defer formatting until a handler wants the record.
+log = logging.getLogger("api")
+
 # =============================================================================
 # CACHING SYSTEM - Saves API quota by caching data
 # =============================================================================
 
 class DataCache:
-    """Simple in-memory cache with TTL (time-to-live)."""
-    
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
-        self.cache = {}
+    """Simple in-memory LRU cache with TTL (time-to-live)."""
+
+    def __init__(self, default_ttl: int = 300, maxsize: int = 1024):  # 5 minutes default
+        self.cache: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
         self.default_ttl = default_ttl
-    
+        self.maxsize = maxsize
+
     def get(self, key: str, allow_stale: bool = False) -> tuple[Any, bool]:
         """Get cached data without serving expired betting data by default."""
         if key not in self.cache:
             return None, False
-        
+
         data, timestamp, ttl = self.cache[key]
+        self.cache.move_to_end(key)
         age = time.time() - timestamp
-        
+
         if age > ttl:
             return (data, False) if allow_stale else (None, False)
-        
+
         return data, True
-    
+
     def set(self, key: str, data: Any, ttl: int = None):
-        """Cache data with optional custom TTL."""
+        """Cache data with optional custom TTL, evicting the LRU entry when full."""
+        if key not in self.cache and len(self.cache) >= self.maxsize:
+            self.cache.popitem(last=False)
         self.cache[key] = (data, time.time(), ttl or self.default_ttl)
+        self.cache.move_to_end(key)
     
     def invalidate(self, key: str = None):
         """Clear specific key or all cache."""
@@ -96,6 +117,61 @@ cache = DataCache(default_ttl=300)
 refresh_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 store = PipelineStore()
 
+
+def _cache_key_part(value: Any) -> str:
+    if isinstance(value, (set, frozenset)):
+        return ",".join(sorted(str(item) for item in value))
+    return str(value).lower()
+
+
+# Fetches currently on the wire, keyed like the cache ("single-flight"):
+# concurrent callers for the same key await one task instead of each
+# issuing their own outbound request.
+_in_flight_fetches: dict[str, asyncio.Task] = {}
+
+
+def cached_fetcher(prefix: str, ttl: int):
+    """Memoize an async fetcher through the module-level DataCache.
+
+    The key is built from the arguments after the session, so repeat calls
+    for the same sport/market within the TTL are served from memory instead
+    of re-spending Odds API quota. While a fetch is in flight, concurrent
+    callers share its task. Empty results are never cached so a transient
+    failure does not mask the next attempt.
+
+    ``refresh=True`` skips the cache read so authorized force-refreshes
+    reach upstream instead of re-serving a memoized result; an in-flight
+    fetch is still joined because its response is genuinely fresh.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(session, *args, refresh: bool = False, **kwargs):
+            key = ":".join([
+                prefix,
+                *(_cache_key_part(arg) for arg in args),
+                *(_cache_key_part(value) for value in kwargs.values()),
+            ])
+            if not refresh:
+                data, fresh = cache.get(key)
+                if fresh:
+                    return data
+            existing = _in_flight_fetches.get(key)
+            if existing is not None:
+                # shield() keeps one cancelled waiter from killing the
+                # fetch for everyone else awaiting it.
+                return await asyncio.shield(existing)
+            task = asyncio.create_task(func(session, *args, **kwargs))
+            _in_flight_fetches[key] = task
+            try:
+                result = await task
+            finally:
+                _in_flight_fetches.pop(key, None)
+            if result:
+                cache.set(key, result, ttl=ttl)
+            return result
+        return wrapper
+    return decorator
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -282,7 +358,10 @@ def get_odds_api_key() -> str | None:
 app = FastAPI(
     title="EV Dashboard API",
     description="Find +EV plays across DFS pick'em platforms",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large prop/EV payloads C-side, much faster
+    # than the stdlib json encoder FastAPI defaults to.
+    default_response_class=ORJSONResponse,
 )
 
 # Allow frontend to access API.
@@ -314,10 +393,64 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+_http_session: aiohttp.ClientSession | None = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide ClientSession, creating it lazily.
+
+    One shared session means outbound calls reuse keep-alive connections
+    and the DNS cache instead of handshaking per request. Callers outside
+    the FastAPI app (bot, CLI) can use this too instead of opening their
+    own throwaway sessions.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                # Sized for the worst case: sport=all fans out 4 fetchers x
+                # 11 sports plus the per-event sharp-odds requests, almost
+                # all of it against api.the-odds-api.com.
+                limit=200,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _http_session
+
+
+@app.on_event("startup")
+async def create_http_session() -> None:
+    app.state.session = await get_http_session()
+
+
+@app.on_event("shutdown")
+async def close_http_session() -> None:
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
+# Cache lifetimes tiered by volatility: EV plays chase moving odds, props
+# boards shift by the minute, middles depend on two boards at once, and
+# game schedules barely change within an hour.
+PROPS_CACHE_TTL = int(os.getenv("PROPS_CACHE_TTL", "60"))
+EV_CACHE_TTL = int(os.getenv("EV_CACHE_TTL", "30"))
+MIDDLES_CACHE_TTL = int(os.getenv("MIDDLES_CACHE_TTL", "120"))
+GAMES_CACHE_TTL = int(os.getenv("GAMES_CACHE_TTL", "300"))
+# Usage dashboards poll aggressively; a short TTL keeps them from burning
+# real quota on every poll while staying close to live.
+USAGE_CACHE_TTL = int(os.getenv("USAGE_CACHE_TTL", "20"))
+
 # PrizePicks League IDs (direct API is often blocked; Odds API us_dfs is primary)
 PP_LEAGUE_IDS = {
     "nba": 7,
@@ -351,7 +484,7 @@ UD_SPORTS = {
 }
 
 # Sports included when callers pass sport=all (each scanned separately)
-MAIN_SPORTS = [
+MAIN_SPORTS: tuple[str, ...] = (
     "mlb",
     "nba",
     "nfl",
@@ -363,7 +496,7 @@ MAIN_SPORTS = [
     "mls",
     "epl",
     "summer",
-]
+)
 
 # The Odds API sport keys used for DFS props + sharp books
 ODDS_API_SPORTS = {
@@ -482,6 +615,10 @@ PROP_MAPPINGS = {
     "shots_on_goal": "player_shots_on_goal",
 }
 
+# Lowercased-key mirror so stat labels that only differ in casing between
+# platforms still resolve instead of silently missing.
+PROP_MAPPINGS_CI = {key.lower(): value for key, value in PROP_MAPPINGS.items()}
+
 # Ambiguous labels such as Points, Assists, Goals, and Shots must be resolved
 # in the context of a sport rather than by one global dictionary.
 _BASKETBALL_MARKET_MAP = {
@@ -540,7 +677,11 @@ SPORT_MARKET_MAPPINGS: dict[str, dict[str, str]] = {
 
 def market_for_stat(stat_type: str, sport: str) -> str | None:
     sport_map = SPORT_MARKET_MAPPINGS.get(sport.lower(), {})
-    return sport_map.get(stat_type) or PROP_MAPPINGS.get(stat_type)
+    return (
+        sport_map.get(stat_type)
+        or PROP_MAPPINGS.get(stat_type)
+        or PROP_MAPPINGS_CI.get(stat_type.lower())
+    )
 
 
 def canonical_market_key(market_key: str) -> str:
@@ -570,6 +711,12 @@ BREAKEVEN = {
     },
 }
 
+# Flat platform -> default break-even mirror so the hot EV loop does one
+# dict lookup instead of two (the miss path also allocated an empty dict).
+PLATFORM_DEFAULT_BE = {
+    platform: table["default"] for platform, table in BREAKEVEN.items()
+}
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
@@ -588,6 +735,18 @@ class Prop(BaseModel):
     market_key: Optional[str] = None
     is_alternate: bool = False
     captured_at: str = ""
+    # Normalized forms computed once at construction so filters and fuzzy
+    # matchers never re-lowercase the same strings per request.
+    player_name_norm: str = ""
+    stat_type_norm: str = ""
+
+    @model_validator(mode="after")
+    def _fill_normalized_fields(self) -> "Prop":
+        if not self.player_name_norm:
+            self.player_name_norm = normalize_player_name(self.player_name)
+        if not self.stat_type_norm:
+            self.stat_type_norm = self.stat_type.lower()
+        return self
 
 class SharpOdds(BaseModel):
     bookmaker: str
@@ -652,7 +811,7 @@ async def fetch_prizepicks_direct(session: aiohttp.ClientSession, sport: str) ->
     """Fetch props from PrizePicks API."""
     league_id = PP_LEAGUE_IDS.get(sport.lower())
     if not league_id:
-        print(f"[PrizePicks Direct] Unknown sport: {sport}")
+        log.debug("[PrizePicks Direct] Unknown sport: %s", sport)
         return []
     
     url = f"https://api.prizepicks.com/projections?league_id={league_id}&per_page=250&single_stat=true"
@@ -673,21 +832,24 @@ async def fetch_prizepicks_direct(session: aiohttp.ClientSession, sport: str) ->
     
     try:
         async with session.get(url, headers=headers, timeout=10) as resp:
-            print(f"[PrizePicks Direct] API response status: {resp.status} for {sport.upper()}")
+            log.debug("[PrizePicks Direct] API response status: %s for %s", resp.status, sport.upper())
             if resp.status != 200:
-                print(f"[PrizePicks Direct] Failed - status {resp.status}")
+                log.warning("[PrizePicks Direct] Failed - status %s", resp.status)
                 return []
             
-            data = await resp.json()
+            data = await _read_json(resp)
             included = {i["id"]: i for i in data.get("included", [])}
-            props = []
-            
-            for proj in data.get("data", []):
+            entries = data.get("data", [])
+            # One prop per projection, so the size is known up front;
+            # index-assign skips append's geometric regrowth.
+            props: list[Prop] = [None] * len(entries)  # type: ignore[list-item]
+
+            for index, proj in enumerate(entries):
                 attrs = proj.get("attributes", {})
                 player_id = proj.get("relationships", {}).get("new_player", {}).get("data", {}).get("id")
                 player_data = included.get(player_id, {}).get("attributes", {})
-                
-                props.append(Prop(
+
+                props[index] = Prop(
                     id=f"pp_{proj.get('id', '')}",
                     player_name=player_data.get("name", "Unknown"),
                     team=player_data.get("team", ""),
@@ -696,14 +858,12 @@ async def fetch_prizepicks_direct(session: aiohttp.ClientSession, sport: str) ->
                     platform="prizepicks",
                     line=float(attrs.get("line_score", 0)),
                     game_time=attrs.get("start_time", ""),
-                ))
-            
-            print(f"[PrizePicks Direct] Got {len(props)} props for {sport.upper()}")
+                )
+
+            log.debug("[PrizePicks Direct] Got %d props for %s", len(props), sport.upper())
             return props
-    except Exception as e:
-        print(f"[PrizePicks Direct] Error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("[PrizePicks Direct] Error fetching %s", sport)
         return []
 
 
@@ -800,26 +960,67 @@ DFS_MARKETS_BY_SPORT: dict[str, list[str]] = {
     "epl": _SOCCER_DFS_MARKETS,
 }
 
+def _reverse_stat_lookup(mapping: dict[str, str]) -> dict[str, str]:
+    """Invert a stat->market mapping, keeping the first label per market."""
+    reverse: dict[str, str] = {}
+    for stat_label, market in mapping.items():
+        reverse.setdefault(sys.intern(market), sys.intern(stat_label))
+    return reverse
+
+# Reverse lookups built once at import so market_to_stat is a dict hit per
+# outcome instead of a linear scan over the mapping tables. MappingProxyType
+# keeps them read-only; interned keys turn the probe into a pointer compare.
+MARKET_TO_STAT_BY_SPORT = MappingProxyType({
+    sport: MappingProxyType(_reverse_stat_lookup(mapping))
+    for sport, mapping in SPORT_MARKET_MAPPINGS.items()
+})
+MARKET_TO_STAT_GLOBAL = MappingProxyType(_reverse_stat_lookup({
+    stat_label: market
+    for stat_label, market in PROP_MAPPINGS.items()
+    if stat_label and stat_label[0].isupper()
+}))
+
 def market_to_stat(market_key: str, sport: str) -> str:
     """Return a stable display label for standard and alternate markets."""
-    canonical = canonical_market_key(market_key)
-    sport_map = SPORT_MARKET_MAPPINGS.get(sport.lower(), {})
-    for stat_label, mapped_market in sport_map.items():
-        if mapped_market == canonical:
+    canonical = sys.intern(canonical_market_key(market_key))
+    sport_reverse = MARKET_TO_STAT_BY_SPORT.get(sport.lower())
+    if sport_reverse is not None:
+        stat_label = sport_reverse.get(canonical)
+        if stat_label is not None:
             return stat_label
-    for stat_label, mapped_market in PROP_MAPPINGS.items():
-        if (
-            isinstance(stat_label, str)
-            and stat_label
-            and stat_label[0].isupper()
-            and mapped_market == canonical
-        ):
-            return stat_label
-    return canonical
+    return MARKET_TO_STAT_GLOBAL.get(canonical, canonical)
 
 def _safe_id(*parts: str) -> str:
-    raw = "|".join([p or "" for p in parts])
-    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+    """Stable content id for props/candidates; not security-sensitive."""
+    raw = b"|".join(p.encode("utf-8") if p else b"" for p in parts)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a response body with orjson, off the event loop when large.
+
+    Multi-megabyte odds payloads parsed inline would stall every other
+    coroutine; above ~100KB the decode runs on a worker thread instead.
+    """
+    raw = await response.read()
+    if len(raw) > 100_000:
+        return await asyncio.to_thread(orjson.loads, raw)
+    return orjson.loads(raw)
+
+
+# Per-event fan-out width; The Odds API handles this comfortably over one
+# keep-alive pool, and _fanout_limit throttles it when quota runs low.
+ODDS_API_CONCURRENCY = int(os.getenv("ODDS_API_CONCURRENCY", "12"))
+_TRANSIENT_RETRIES = 2
+
+
+def _fanout_limit() -> int:
+    """Concurrency for per-event odds requests, sized from known quota."""
+    key_preview = (api_key_manager.current_key or "")[:8]
+    remaining = api_key_manager.key_usage.get(key_preview, {}).get("remaining")
+    if remaining is not None:
+        return max(2, min(ODDS_API_CONCURRENCY, remaining))
+    return ODDS_API_CONCURRENCY
 
 
 async def _odds_api_get(
@@ -828,40 +1029,95 @@ async def _odds_api_get(
     params: dict[str, Any] | None = None,
     timeout: int = 20,
 ) -> tuple[int, Any]:
-    """GET The Odds API with quota tracking and bounded key rotation."""
+    """GET The Odds API with quota tracking, bounded key rotation, and
+    exponential-backoff retry on transient (5xx / network) failures."""
     request_params = dict(params or {})
     attempts = max(1, len(api_key_manager.keys))
 
     for _ in range(attempts):
         request_params["apiKey"] = get_odds_api_key()
-        try:
-            async with session.get(url, params=request_params, timeout=timeout) as response:
-                remaining = response.headers.get("x-requests-remaining")
-                used = response.headers.get("x-requests-used")
-                if (
-                    response.status not in {401, 403, 429}
-                    and remaining
-                    and used
-                    and remaining.isdigit()
-                    and used.isdigit()
-                ):
-                    api_key_manager.update_usage(int(remaining), int(used))
+        for retry in range(_TRANSIENT_RETRIES + 1):
+            try:
+                async with session.get(url, params=request_params, timeout=timeout) as response:
+                    remaining = response.headers.get("x-requests-remaining")
+                    used = response.headers.get("x-requests-used")
+                    if (
+                        response.status not in {401, 403, 429}
+                        and remaining
+                        and used
+                        and remaining.isdigit()
+                        and used.isdigit()
+                    ):
+                        api_key_manager.update_usage(int(remaining), int(used))
 
-                try:
-                    payload = await response.json(content_type=None)
-                except Exception:
-                    payload = {"message": (await response.text())[:500]}
+                    try:
+                        payload = await _read_json(response)
+                    except Exception:
+                        payload = {"message": (await response.text())[:500]}
 
-                if response.status not in {401, 403, 429}:
-                    return response.status, payload
+                    if response.status >= 500 and retry < _TRANSIENT_RETRIES:
+                        await asyncio.sleep(0.2 * (2 ** retry))
+                        continue
 
-                api_key_manager.mark_key_exhausted()
-        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
-            return 599, {"message": str(exc)}
+                    if response.status not in {401, 403, 429}:
+                        return response.status, payload
+
+                    # Quota/auth failure: rotate and retry with the next key.
+                    api_key_manager.mark_key_exhausted()
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                if retry < _TRANSIENT_RETRIES:
+                    await asyncio.sleep(0.2 * (2 ** retry))
+                    continue
+                return 599, {"message": str(exc)}
 
     return 429, {"message": "No Odds API key with remaining quota"}
 
 
+# Base Odds API URL built once via yarl (validates scheme/host at import);
+# per-sport event URLs are cached strings so the hot fan-out only appends
+# the /{event_id}/odds suffix instead of re-interpolating the whole URL.
+# URLs stay str at the _odds_api_get seam — its callers and tests treat
+# them as strings.
+_ODDS_API_SPORTS_URL = URL("https://api.the-odds-api.com/v4/sports")
+
+
+@functools.lru_cache(maxsize=32)
+def _sport_events_url(sport_key: str) -> str:
+    return str(_ODDS_API_SPORTS_URL / sport_key / "events")
+
+
+# /events is hit once per sport per fetcher per refresh; a short TTL cache
+# collapses those into one quota-charged round-trip per sport per cycle.
+_events_cache: TTLCache = TTLCache(maxsize=32, ttl=int(os.getenv("ODDS_EVENTS_TTL", "45")))
+_events_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _get_events(session: aiohttp.ClientSession, sport_key: str) -> list[dict] | None:
+    """Fetch the event list for a sport with TTL caching and single-flight.
+
+    Concurrent misses for the same sport coalesce behind a per-sport lock
+    so only one request goes out; failures are not cached.
+    """
+    cached = _events_cache.get(sport_key)
+    if cached is not None:
+        return cached
+    async with _events_locks[sport_key]:
+        cached = _events_cache.get(sport_key)
+        if cached is not None:
+            return cached
+        status, payload = await _odds_api_get(
+            session,
+            _sport_events_url(sport_key),
+            {"dateFormat": "iso"},
+            timeout=15,
+        )
+        if status != 200 or not isinstance(payload, list):
+            return None
+        _events_cache[sport_key] = payload
+        return payload
+
+
 async def fetch_dfs_props_from_odds_api(
     session: aiohttp.ClientSession,
     sport: str,
@@ -888,15 +1144,9 @@ async def fetch_dfs_props_from_odds_api(
     if not markets:
         return []
 
-    events_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events"
-    event_status, events = await _odds_api_get(
-        session,
-        events_url,
-        {"dateFormat": "iso"},
-        timeout=15,
-    )
-    if event_status != 200 or not isinstance(events, list):
-        print(f"[DFS Props] Events fetch failed ({platform_key}): {event_status} {events}")
+    events = await _get_events(session, sport_key)
+    if events is None:
+        log.warning("[DFS Props] Events fetch failed (%s)", platform_key)
         return []
 
     now = datetime.now(timezone.utc)
@@ -912,14 +1162,14 @@ async def fetch_dfs_props_from_odds_api(
 
     event_limit = max(1, int(os.getenv("DFS_EVENT_LIMIT", "8")))
     market_limit = max(1, int(os.getenv("DFS_MARKET_LIMIT", "4")))
-    sem = asyncio.Semaphore(4)
+    sem = asyncio.Semaphore(_fanout_limit())
 
     async def _fetch_event_odds(event: dict) -> list[dict]:
         event_id = event.get("id")
         if not event_id:
             return []
 
-        base_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{event_id}"
+        base_url = f"{_sport_events_url(sport_key)}/{event_id}"
         discovery_params = {
             "regions": "us_dfs",
             "bookmakers": bookmaker_key,
@@ -932,7 +1182,7 @@ async def fetch_dfs_props_from_odds_api(
                 discovery_params,
             )
         if discovery_status != 200 or not isinstance(discovery, dict):
-            print(f"[DFS Props] Market discovery failed for {event_id}: {discovery_status}")
+            log.warning("[DFS Props] Market discovery failed for %s: %s", event_id, discovery_status)
             return []
 
         desired_bases = set(markets)
@@ -989,7 +1239,7 @@ async def fetch_dfs_props_from_odds_api(
                     payloads.append(single_payload)
             return payloads
 
-        print(f"[DFS Props] Odds fetch failed for {event_id}: {odds_status}")
+        log.warning("[DFS Props] Odds fetch failed for %s: %s", event_id, odds_status)
         return []
 
     payload_groups = await asyncio.gather(
@@ -1001,31 +1251,38 @@ async def fetch_dfs_props_from_odds_api(
     platform_norm = platform_key.lower()
     sport_norm = sport_l.upper()
     captured_at = datetime.now(timezone.utc).isoformat()
-    seen_props: set[tuple[str, str, float, str]] = set()
+    # Dedup keys are packed ints rather than 4-tuples: one set probe hashes
+    # a single int instead of re-hashing four objects per outcome, and the
+    # event/market components are folded in once per scope below.
+    seen_props: set[int] = set()
+    market_ids: dict[str, int] = {}
 
     for payload in odds_payloads:
         commence_time = payload.get("commence_time") or payload.get("commenceTime")
-        event_id = payload.get("id") or ""
+        event_id = str(payload.get("id") or "")
         home = payload.get("home_team") or ""
         away = payload.get("away_team") or ""
         opponent_label = f"{away} @ {home}" if home and away else None
+        event_hash = hash(event_id) << 1
 
         for bookmaker in payload.get("bookmakers", []) or []:
             for mkt in bookmaker.get("markets", []) or []:
                 market_key = mkt.get("key") or ""
                 stat_type = market_to_stat(market_key, sport_l)
+                market_stub = (market_ids.setdefault(market_key, len(market_ids)) << 48) ^ event_hash
                 for outcome in mkt.get("outcomes", []) or []:
                     player = outcome.get("description") or outcome.get("participant") or ""
                     point = outcome.get("point")
                     if not player or point is None:
                         continue
 
-                    dedupe_key = (player, market_key, float(point), str(event_id))
+                    line = float(point)
+                    dedupe_key = hash(player) ^ market_stub ^ (int(line * 100) << 24)
                     if dedupe_key in seen_props:
                         continue
                     seen_props.add(dedupe_key)
 
-                    prop_id = _safe_id(platform_norm, sport_norm, market_key, player, str(point), str(event_id))
+                    prop_id = _safe_id(platform_norm, sport_norm, market_key, player, str(point), event_id)
                     props.append(Prop(
                         id=prop_id,
                         player_name=player,
@@ -1034,9 +1291,9 @@ async def fetch_dfs_props_from_odds_api(
                         sport=sport_norm,
                         stat_type=stat_type,
                         platform=platform_norm,
-                        line=float(point),
+                        line=line,
                         game_time=commence_time,
-                        event_id=str(event_id),
+                        event_id=event_id,
                         market_key=canonical_market_key(market_key),
                         is_alternate=market_key.endswith("_alternate"),
                         captured_at=captured_at,
@@ -1044,6 +1301,7 @@ async def fetch_dfs_props_from_odds_api(
 
     return props
 
+@cached_fetcher("fetch_pp", ttl=60)
 async def fetch_prizepicks(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """Fetch PrizePicks props via Odds API (direct API is blocked by captcha)."""
     # NOTE: PrizePicks direct API is blocked by PerimeterX captcha on server requests
@@ -1051,23 +1309,108 @@ async def fetch_prizepicks(session: aiohttp.ClientSession, sport: str) -> list[P
     
     props = await fetch_dfs_props_from_odds_api(session, sport, "prizepicks")
     if props:
-        print(f"[PrizePicks] Got {len(props)} props from Odds API for {sport.upper()}")
+        log.debug("[PrizePicks] Got %d props from Odds API for %s", len(props), sport.upper())
     else:
-        print(f"[PrizePicks] No props found for {sport.upper()} (Odds API may not have data)")
+        log.debug("[PrizePicks] No props found for %s (Odds API may not have data)", sport.upper())
+    return props
+
+
+def _parse_underdog_payload(raw: bytes, target_sport: str, prop_sport: str) -> list[Prop]:
+    """Decode and transform an Underdog payload into Props.
+
+    Pure CPU work kept in one sync function so fetch_underdog can run the
+    whole decode + 5-20k line transform on a worker thread instead of
+    stalling the event loop.
+    """
+    data = orjson.loads(raw)
+
+    # Build lookup dictionaries with dict(zip(map(...))) so the id
+    # extraction runs in the C layer instead of a Python dict-comp.
+    get_id = itemgetter("id")
+    # games[].id is numeric, sport_id is string like "NBA"
+    games_list = data.get("games", [])
+    games = dict(zip(map(get_id, games_list), games_list))
+    # appearances[].id is UUID string, has match_id (numeric) and player_id (UUID)
+    appearances_list = data.get("appearances", [])
+    appearances = dict(zip(map(get_id, appearances_list), appearances_list))
+    # players[].id is UUID string
+    players_list = data.get("players", [])
+    players = dict(zip(map(get_id, players_list), players_list))
+
+    log.debug("[Underdog] Found %d games, %d appearances, %d players", len(games), len(appearances), len(players))
+
+    # Get all over_under_lines
+    lines = data.get("over_under_lines", [])
+    log.debug("[Underdog] Found %d over_under_lines", len(lines))
+
+    props: list[Prop] = []
+    # Hoist bound methods out of the loop; these run per line.
+    _appearances_get = appearances.get
+    _players_get = players.get
+    _games_get = games.get
+    _empty: dict = {}
+    for line in lines:
+        try:
+            # Direct indexing: a missing key lands in the except
+            # below, and the common path skips the chained .get()
+            # calls and their default-dict allocations.
+            app_stat = line["over_under"]["appearance_stat"]
+            app = _appearances_get(app_stat["appearance_id"], _empty)
+
+            # Get game via match_id from appearance
+            game = _games_get(app.get("match_id"), _empty)
+
+            # Filter by sport - game.sport_id is a string like "NBA"
+            if game.get("sport_id", "") != target_sport:
+                continue
+
+            # Get player info via player_id from appearance
+            player = _players_get(app.get("player_id"), _empty)
+
+            # Get stat type from appearance_stat
+            stat_type = (app_stat.get("display_stat") or app_stat.get("stat") or "").strip()
+
+            # Get line value - it's a STRING in the API!
+            stat_value = line.get("stat_value")
+
+            if stat_value is not None and player:
+                name = f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
+
+                if name:
+                    # Get team from game title (e.g., "MIL @ BOS" -> "MIL")
+                    game_title = game.get("title", "") or game.get("abbreviated_title", "")
+                    team = game_title.split(" @ ")[0] if " @ " in game_title else ""
+
+                    props.append(Prop(
+                        id=f"ud_{line.get('id', '')}",
+                        player_name=name,
+                        team=team,
+                        sport=prop_sport,
+                        stat_type=stat_type,
+                        platform="underdog",
+                        line=float(stat_value),  # Convert string to float
+                        game_time=game.get("scheduled_at", ""),
+                    ))
+        except Exception:
+            # Skip this line if there's an error parsing it
+            continue
+
+    log.debug("[Underdog] Returning %d props for %s (ud=%s)", len(props), prop_sport, target_sport)
     return props
 
 
+@cached_fetcher("fetch_ud", ttl=60)
 async def fetch_underdog(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """Fetch props from Underdog Fantasy API - TESTED AND WORKING."""
     sport_l = sport.lower()
     target_sport = UD_SPORTS.get(sport_l)
     if not target_sport:
-        print(f"[Underdog] No sport mapping for {sport}")
+        log.debug("[Underdog] No sport mapping for %s", sport)
         return []
     # Keep the caller's sport key on props so Odds API matching stays consistent
     # (e.g. mls maps to Underdog FIFA but still tags props as MLS).
     prop_sport = sport_l.upper()
-    
+
     url = "https://api.underdogfantasy.com/beta/v6/over_under_lines"
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1077,88 +1420,22 @@ async def fetch_underdog(session: aiohttp.ClientSession, sport: str) -> list[Pro
         "Origin": "https://underdogfantasy.com",
         "Referer": "https://underdogfantasy.com/",
     }
-    
+
     try:
         async with session.get(url, headers=headers, timeout=30) as resp:
-            print(f"[Underdog] API response status: {resp.status}")
+            log.debug("[Underdog] API response status: %s", resp.status)
             if resp.status != 200:
-                print(f"[Underdog] Failed to fetch - status {resp.status}")
+                log.warning("[Underdog] Failed to fetch - status %s", resp.status)
                 return []
-            
-            data = await resp.json()
-            
-            # Build lookup dictionaries
-            # games[].id is numeric, sport_id is string like "NBA"
-            games = {g["id"]: g for g in data.get("games", [])}
-            # appearances[].id is UUID string, has match_id (numeric) and player_id (UUID)
-            appearances = {a["id"]: a for a in data.get("appearances", [])}
-            # players[].id is UUID string
-            players = {p["id"]: p for p in data.get("players", [])}
-            
-            print(f"[Underdog] Found {len(games)} games, {len(appearances)} appearances, {len(players)} players")
-            
-            # Get all over_under_lines
-            lines = data.get("over_under_lines", [])
-            print(f"[Underdog] Found {len(lines)} over_under_lines")
-            
-            props = []
-            for line in lines:
-                try:
-                    # Get the over_under object which contains appearance_stat
-                    ou = line.get("over_under", {})
-                    app_stat = ou.get("appearance_stat", {})
-                    
-                    # Get appearance_id from appearance_stat (it's like "uuid-uuid")
-                    app_id = app_stat.get("appearance_id")
-                    app = appearances.get(app_id, {})
-                    
-                    # Get game via match_id from appearance
-                    match_id = app.get("match_id")
-                    game = games.get(match_id, {})
-                    
-                    # Filter by sport - game.sport_id is a string like "NBA"
-                    game_sport = game.get("sport_id", "")
-                    if game_sport != target_sport:
-                        continue
-                    
-                    # Get player info via player_id from appearance
-                    player_id = app.get("player_id")
-                    player = players.get(player_id, {})
-                    
-                    # Get stat type from appearance_stat
-                    stat_type = (app_stat.get("display_stat") or app_stat.get("stat") or "").strip()
-                    
-                    # Get line value - it's a STRING in the API!
-                    stat_value = line.get("stat_value")
-                    
-                    if stat_value is not None and player:
-                        name = f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
-                        
-                        if name:
-                            # Get team from game title (e.g., "MIL @ BOS" -> "MIL")
-                            game_title = game.get("title", "") or game.get("abbreviated_title", "")
-                            team = game_title.split(" @ ")[0] if " @ " in game_title else ""
-                            
-                            props.append(Prop(
-                                id=f"ud_{line.get('id', '')}",
-                                player_name=name,
-                                team=team,
-                                sport=prop_sport,
-                                stat_type=stat_type,
-                                platform="underdog",
-                                line=float(stat_value),  # Convert string to float
-                                game_time=game.get("scheduled_at", ""),
-                            ))
-                except Exception as e:
-                    # Skip this line if there's an error parsing it
-                    continue
-            
-            print(f"[Underdog] Returning {len(props)} props for {prop_sport} (ud={target_sport})")
-            return props
-    except Exception as e:
-        print(f"[Underdog] Error: {e}")
-        import traceback
-        traceback.print_exc()
+
+            raw = await resp.read()
+        # The full-board payload is routinely multi-megabyte; decode and
+        # transform it off the event loop. Small bodies stay inline.
+        if len(raw) > 100_000:
+            return await asyncio.to_thread(_parse_underdog_payload, raw, target_sport, prop_sport)
+        return _parse_underdog_payload(raw, target_sport, prop_sport)
+    except Exception:
+        log.exception("[Underdog] Error fetching %s", sport)
         return []
 
 
@@ -1208,7 +1485,8 @@ async def collect_props(
     refresh: bool = False,
 ) -> tuple[list[Prop], bool]:
     """Canonical, single-flight prop collection used by every client."""
-    cache_key = f"props_{sport.lower()}"
+    sport_l = sport.lower()
+    cache_key = f"props_{sport_l}"
     if not refresh:
         cached, fresh = cache.get(cache_key)
         if cached is not None:
@@ -1222,18 +1500,26 @@ async def collect_props(
                     Prop(**payload)
                     for payload in latest["payload"].get("props", [])
                 ]
-                cache.set(cache_key, restored)
+                cache.set(cache_key, restored, ttl=PROPS_CACHE_TTL)
+                cache.set(
+                    f"props_dump_{sport_l}",
+                    [prop.model_dump() for prop in restored],
+                    ttl=PROPS_CACHE_TTL,
+                )
                 return restored, False
         return [], False
 
     async with refresh_locks[cache_key]:
-        sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
+        sports_to_fetch = MAIN_SPORTS if sport_l == "all" else [sport_l]
         tasks = []
         for current_sport in sports_to_fetch:
             tasks.extend(
                 [
-                    fetch_prizepicks(session, current_sport),
-                    fetch_underdog(session, current_sport),
+                    # refresh=True bypasses the fetcher-level memoization so a
+                    # forced refresh records genuinely fresh data, not a
+                    # recently cached result with a new timestamp.
+                    fetch_prizepicks(session, current_sport, refresh=True),
+                    fetch_underdog(session, current_sport, refresh=True),
                     fetch_betr_picks(session, current_sport),
                     fetch_chalkboard(session, current_sport),
                 ]
@@ -1246,12 +1532,14 @@ async def collect_props(
                 prop.market_key = market_for_stat(prop.stat_type, prop.sport)
             if not prop.captured_at:
                 prop.captured_at = captured_at
-        cache.set(cache_key, props)
+        dumped = [prop.model_dump() for prop in props]
+        cache.set(cache_key, props, ttl=PROPS_CACHE_TTL)
+        cache.set(f"props_dump_{sport_l}", dumped, ttl=PROPS_CACHE_TTL)
         store.save_run(
             "props",
             sport,
             "ok" if props else "empty",
-            {"props": [prop.model_dump() for prop in props]},
+            {"props": dumped},
             {
                 "count": len(props),
                 "platforms": {
@@ -1286,6 +1574,13 @@ SHARP_BOOKS = [
     "fliff",         # Fliff
 ]
 
+# O(1) rank/membership lookups for the per-event bookmaker sort below;
+# list.index inside a sort key re-scanned SHARP_BOOKS per bookmaker.
+SHARP_RANK = {key: index for index, key in enumerate(SHARP_BOOKS)}
+
+# Books whose prices count as sharp when flagging consensus rows.
+SHARP_SET = frozenset({"pinnacle", "draftkings", "fanduel", "lowvig"})
+
 # Market priority for EV (fetch these first to maximize matches)
 MARKET_PRIORITY_BY_SPORT = {
     sport: markets for sport, markets in DFS_MARKETS_BY_SPORT.items()
@@ -1295,6 +1590,7 @@ MARKET_PRIORITY_BY_SPORT = {
 SHARP_EVENT_LIMIT = int(os.getenv("SHARP_EVENT_LIMIT", "8"))
 SHARP_MARKET_LIMIT = int(os.getenv("SHARP_MARKET_LIMIT", "4"))
 
+@cached_fetcher("fetch_sharp", ttl=120)
 async def fetch_sharp_odds(
     session: aiohttp.ClientSession,
     sport: str,
@@ -1302,9 +1598,16 @@ async def fetch_sharp_odds(
     event_ids: set[str] | None = None,
     commence_times: set[str] | None = None,
 ) -> list[dict]:
-    """Fetch sportsbook prices for a market and relevant event IDs."""
+    """Fetch sportsbook prices for relevant event IDs.
+
+    ``market`` may be a single market key or a comma-separated batch; The
+    Odds API prices every listed market in one event request, so batching
+    divides the call count by the number of markets.
+    """
     if not get_odds_api_key():
         return []
+
+    market_keys = {key for key in market.split(",") if key}
     
     sport_key = ODDS_API_SPORTS.get(sport.lower())
     if not sport_key:
@@ -1315,10 +1618,9 @@ async def fetch_sharp_odds(
             {"id": event_id}
             for event_id in sorted(event_ids or set())
         ]
-        events_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events"
         if commence_times or not events:
-            status, payload = await _odds_api_get(session, events_url, timeout=15)
-            if status != 200 or not isinstance(payload, list):
+            payload = await _get_events(session, sport_key)
+            if payload is None:
                 return []
             if commence_times:
                 target_times = []
@@ -1353,10 +1655,10 @@ async def fetch_sharp_odds(
         
         all_odds = []
         
-        sem = asyncio.Semaphore(4)
+        sem = asyncio.Semaphore(_fanout_limit())
 
         async def _fetch_event(event: dict) -> list[dict]:
-            odds_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{event['id']}/odds"
+            odds_url = f"{_sport_events_url(sport_key)}/{event['id']}/odds"
             params = {
                 "regions": "us,us2,eu",  # US + EU to get Pinnacle (sharpest book)
                 "markets": market,
@@ -1368,17 +1670,17 @@ async def fetch_sharp_odds(
             async with sem:
                 status, data = await _odds_api_get(session, odds_url, params)
             if status != 200 or not isinstance(data, dict):
-                print(f"[Sharp Odds] Event {event['id']} returned status {status}")
+                log.warning("[Sharp Odds] Event %s returned status %s", event["id"], status)
                 return []
 
             # Sort bookmakers by our preference order (Pinnacle first = sharpest)
             bookmakers = data.get("bookmakers", [])
-            bookmakers.sort(key=lambda b: SHARP_BOOKS.index(b["key"]) if b["key"] in SHARP_BOOKS else 999)
+            bookmakers.sort(key=lambda b: SHARP_RANK.get(b["key"], 999))
 
             event_odds: list[dict] = []
             for bookmaker in bookmakers:
                 for mkt in bookmaker.get("markets", []):
-                    if mkt["key"] != market:
+                    if mkt["key"] not in market_keys:
                         continue
 
                     # Group outcomes by player
@@ -1398,7 +1700,7 @@ async def fetch_sharp_odds(
                         if "over" in outcomes and "under" in outcomes:
                             # Determine if this is a sharp book
                             # Pinnacle is sharpest, then DK/FD
-                            is_sharp = bookmaker["key"] in ["pinnacle", "draftkings", "fanduel", "lowvig"]
+                            is_sharp = bookmaker["key"] in SHARP_SET
 
                             event_odds.append({
                                 "player": player,
@@ -1406,7 +1708,7 @@ async def fetch_sharp_odds(
                                 "over_odds": outcomes["over"].get("price", -110),
                                 "under_odds": outcomes["under"].get("price", -110),
                                 "bookmaker": bookmaker["key"],
-                                "market": market,
+                                "market": mkt["key"],
                                 "is_sharp": is_sharp,
                                 "event_id": str(event["id"]),
                                 "commence_time": data.get("commence_time"),
@@ -1422,20 +1724,23 @@ async def fetch_sharp_odds(
         for event_odds in results:
             all_odds.extend(event_odds)
         
-        print(f"[Sharp Odds] Found {len(all_odds)} odds entries for {market} in {sport}")
+        log.debug("[Sharp Odds] Found %d odds entries for %s in %s", len(all_odds), market, sport)
         return all_odds
-    except Exception as e:
-        print(f"Odds API error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("Odds API error fetching sharp odds for %s", sport)
         return []
 
 # =============================================================================
 # CALCULATIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def calculate_no_vig(over_odds: int, under_odds: int) -> tuple[float, float]:
-    """Calculate true probabilities by removing the vig."""
+    """Calculate true probabilities by removing the vig.
+
+    Odds pairs like (-110, -110) repeat across books and props, so results
+    are memoized by the (over, under) pair.
+    """
     def implied_prob(odds: int) -> float:
         if odds > 0:
             return 100 / (odds + 100)
@@ -1448,10 +1753,27 @@ def calculate_no_vig(over_odds: int, under_odds: int) -> tuple[float, float]:
     
     over_true = (over_implied / total) * 100
     under_true = (under_implied / total) * 100
-    
+
     return over_true, under_true
 
 
+def calculate_no_vig_vec(
+    over_odds: np.ndarray,
+    under_odds: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized calculate_no_vig over parallel arrays of American odds."""
+    # Both branches share the |odds| + 100 denominator, so implied
+    # probability reduces to one where() with no zero denominators.
+    over_implied = np.where(over_odds > 0, 100.0, np.abs(over_odds)) / (
+        np.abs(over_odds) + 100.0
+    )
+    under_implied = np.where(under_odds > 0, 100.0, np.abs(under_odds)) / (
+        np.abs(under_odds) + 100.0
+    )
+    total = over_implied + under_implied
+    return over_implied / total * 100.0, under_implied / total * 100.0
+
+
 BOOK_WEIGHTS = {
     "pinnacle": 3.0,
     "lowvig": 2.5,
@@ -1526,30 +1848,34 @@ def build_consensus(prop: Prop, odds_rows: list[dict]) -> dict[str, Any] | None:
     if not player_rows:
         return None
 
-    weighted_over = 0.0
-    weighted_under = 0.0
-    total_weight = 0.0
-    probabilities = []
-    for row in player_rows:
-        over_probability, under_probability = calculate_no_vig(
-            row["over_odds"],
-            row["under_odds"],
-        )
-        weight = BOOK_WEIGHTS.get(row["bookmaker"], 1.0)
-        weighted_over += over_probability * weight
-        weighted_under += under_probability * weight
-        total_weight += weight
-        probabilities.append(
-            {
-                "bookmaker": row["bookmaker"],
-                "over_probability": round(over_probability, 2),
-                "under_probability": round(under_probability, 2),
-                "weight": weight,
-            }
+    row_count = len(player_rows)
+    over_odds = np.fromiter(
+        (row["over_odds"] for row in player_rows), dtype=np.float64, count=row_count
+    )
+    under_odds = np.fromiter(
+        (row["under_odds"] for row in player_rows), dtype=np.float64, count=row_count
+    )
+    over_true, under_true = calculate_no_vig_vec(over_odds, under_odds)
+    weights = np.fromiter(
+        (BOOK_WEIGHTS.get(row["bookmaker"], 1.0) for row in player_rows),
+        dtype=np.float64,
+        count=row_count,
+    )
+    probabilities = [
+        {
+            "bookmaker": row["bookmaker"],
+            "over_probability": round(over_probability, 2),
+            "under_probability": round(under_probability, 2),
+            "weight": weight,
+        }
+        for row, over_probability, under_probability, weight in zip(
+            player_rows, over_true.tolist(), under_true.tolist(), weights.tolist()
         )
+    ]
 
-    consensus_over = weighted_over / total_weight
-    consensus_under = weighted_under / total_weight
+    total_weight = weights.sum()
+    consensus_over = float(np.dot(over_true, weights) / total_weight)
+    consensus_under = float(np.dot(under_true, weights) / total_weight)
     recommended = "OVER" if consensus_over > consensus_under else "UNDER"
     win_probability = max(consensus_over, consensus_under)
     supporting_probabilities = [
@@ -1577,30 +1903,36 @@ def build_consensus(prop: Prop, odds_rows: list[dict]) -> dict[str, Any] | None:
     }
 
 
-def match_player(name: str, candidates: list[str], threshold: int = 80) -> Optional[str]:
-    """Fuzzy match a player name to a list of candidates."""
-    def normalize(n: str) -> str:
-        n = n.lower().strip()
-        for suffix in [" jr.", " sr.", " iii", " ii", " iv"]:
-            n = n.replace(suffix, "")
-        return n
-    
-    name_norm = normalize(name)
-    best_match = None
-    best_score = 0
-    
-    for candidate in candidates:
-        cand_norm = normalize(candidate)
-        score = max(
-            fuzz.ratio(name_norm, cand_norm),
-            fuzz.partial_ratio(name_norm, cand_norm),
-            fuzz.token_sort_ratio(name_norm, cand_norm),
-        )
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = candidate
-    
-    return best_match
+def normalize_player_name(name: str) -> str:
+    """Normalize a player name for fuzzy comparison."""
+    name = name.lower().strip()
+    for suffix in [" jr.", " sr.", " iii", " ii", " iv"]:
+        name = name.replace(suffix, "")
+    return name
+
+
+def match_player(
+    name: str,
+    candidates: list[str],
+    threshold: int = 80,
+    candidates_norm: list[str] | None = None,
+) -> Optional[str]:
+    """Fuzzy match a player name to a list of candidates.
+
+    Callers matching many names against the same pool can pass a
+    precomputed ``candidates_norm`` so the pool is normalized once
+    instead of per query; the batch scorer runs in C either way.
+    """
+    if candidates_norm is None:
+        candidates_norm = [normalize_player_name(c) for c in candidates]
+    hit = process.extractOne(
+        normalize_player_name(name),
+        candidates_norm,
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=threshold,
+    )
+    return candidates[hit[2]] if hit else None
 
 
 def get_best_slip_types(win_prob: float, platform: str) -> list[str]:
@@ -1618,6 +1950,33 @@ def get_best_slip_types(win_prob: float, platform: str) -> list[str]:
 # API ENDPOINTS
 # =============================================================================
 
+_READ_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=120"
+
+# Bookkeeping fields that change between identical snapshots; excluded
+# from the ETag so revalidating unchanged data can still produce a 304.
+_ETAG_VOLATILE_FIELDS = frozenset({"cached", "cache_fresh"})
+
+
+def cacheable_response(payload: dict, request: Request | None):
+    """Return a read payload with browser/CDN caching headers.
+
+    Computes an ETag over the serialized payload and short-circuits with
+    304 when If-None-Match matches, so repeat dashboard polls cost no
+    bandwidth. Error payloads go out with no-store so a transient quota
+    or network failure is never pinned by a browser or CDN for the cache
+    window. Internal callers that pass no request get the raw dict.
+    """
+    if request is None:
+        return payload
+    if payload.get("error"):
+        return ORJSONResponse(payload, headers={"Cache-Control": "no-store"})
+    hashed = {k: v for k, v in payload.items() if k not in _ETAG_VOLATILE_FIELDS}
+    etag = f'"{hashlib.md5(orjson.dumps(hashed, default=str)).hexdigest()}"'
+    headers = {"Cache-Control": _READ_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
 @app.get("/")
 async def root():
     return {"message": "EV Dashboard API", "version": "1.0.0"}
@@ -1748,7 +2107,7 @@ async def _paper_slate_gate(
     sport_key = ODDS_API_SPORTS.get(sport)
     if not sport_key:
         raise HTTPException(status_code=422, detail=f"Unsupported sport: {sport}")
-    events_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events"
+    events_url = _sport_events_url(sport_key)
     status, payload = await _odds_api_get(session, events_url, timeout=15)
     if status != 200 or not isinstance(payload, list):
         return {"due": False, "reason": "schedule_unavailable", "events": []}
@@ -1812,26 +2171,26 @@ async def run_paper_delivery() -> dict[str, Any]:
     pending = store.list_pending_delivery()
     sent = 0
     failed = 0
-    async with aiohttp.ClientSession() as session:
-        for entry in pending:
-            result = await deliver_paper_entry(session, entry)
-            store.mark_delivery(
-                entry["id"],
-                status=result["status"],
-                error=result.get("error"),
-            )
-            if result["success"]:
-                sent += 1
-            else:
-                failed += 1
+    session = app.state.session
+    for entry in pending:
+        result = await deliver_paper_entry(session, entry)
+        store.mark_delivery(
+            entry["id"],
+            status=result["status"],
+            error=result.get("error"),
+        )
+        if result["success"]:
+            sent += 1
+        else:
+            failed += 1
     return {"pending": len(pending), "sent": sent, "failed": failed}
 
 
 async def run_paper_settlement() -> dict[str, Any]:
     store.freeze_closing_lines_past_lock()
     open_entries = store.list_open_paper_entries()
-    async with aiohttp.ClientSession() as session:
-        actions = await settle_mlb_entries(session, open_entries)
+    session = app.state.session
+    actions = await settle_mlb_entries(session, open_entries)
     settled = 0
     pending = 0
     for action in actions:
@@ -1859,8 +2218,8 @@ async def run_paper_tick(sport: str) -> dict[str, Any]:
         )
 
     async with refresh_locks[f"paper_tick:{normalized_sport}"]:
-        async with aiohttp.ClientSession() as session:
-            gate = await _paper_slate_gate(session, normalized_sport)
+        session = app.state.session
+        gate = await _paper_slate_gate(session, normalized_sport)
         if not gate["due"]:
             latest = {
                 "status": "waiting",
@@ -2055,239 +2414,238 @@ async def debug_sharp_odds(
     market: str = Query("player_points"),
 ):
     """Debug endpoint to test sharp odds fetching directly."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            sport_key = ODDS_API_SPORTS.get(sport.lower())
-            if not sport_key:
-                return {"error": f"Unknown sport: {sport}", "available": list(ODDS_API_SPORTS.keys())}
+    session = app.state.session
+    try:
+        sport_key = ODDS_API_SPORTS.get(sport.lower())
+        if not sport_key:
+            return {"error": f"Unknown sport: {sport}", "available": list(ODDS_API_SPORTS.keys())}
             
-            api_key = get_odds_api_key()
-            if not api_key:
-                return {"error": "No API key configured"}
+        api_key = get_odds_api_key()
+        if not api_key:
+            return {"error": "No API key configured"}
             
-            # Get events
-            events_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events"
-            async with session.get(events_url, params={"apiKey": api_key}, timeout=15) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    return {"error": f"Events fetch failed: {resp.status}", "detail": text[:500]}
-                events = await resp.json()
+        # Get events
+        events_url = _sport_events_url(sport_key)
+        async with session.get(events_url, params={"apiKey": api_key}, timeout=15) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                return {"error": f"Events fetch failed: {resp.status}", "detail": text[:500]}
+            events = await _read_json(resp)
             
-            if not events:
-                return {"error": "No events found", "sport_key": sport_key}
+        if not events:
+            return {"error": "No events found", "sport_key": sport_key}
             
-            # Get odds for first event
-            event = events[0]
-            odds_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{event['id']}/odds"
-            params = {
-                "apiKey": api_key,
-                "regions": "us,us2,eu",
-                "markets": market,
-                "oddsFormat": "american",
-                "bookmakers": "pinnacle,draftkings,fanduel,betmgm,bovada",
-            }
+        # Get odds for first event
+        event = events[0]
+        odds_url = f"{_sport_events_url(sport_key)}/{event['id']}/odds"
+        params = {
+            "apiKey": api_key,
+            "regions": "us,us2,eu",
+            "markets": market,
+            "oddsFormat": "american",
+            "bookmakers": "pinnacle,draftkings,fanduel,betmgm,bovada",
+        }
             
-            async with session.get(odds_url, params=params, timeout=15) as resp:
-                remaining = resp.headers.get("x-requests-remaining", "unknown")
-                used = resp.headers.get("x-requests-used", "unknown")
+        async with session.get(odds_url, params=params, timeout=15) as resp:
+            remaining = resp.headers.get("x-requests-remaining", "unknown")
+            used = resp.headers.get("x-requests-used", "unknown")
                 
-                if resp.status != 200:
-                    text = await resp.text()
-                    return {
-                        "error": f"Odds fetch failed: {resp.status}",
-                        "detail": text[:500],
-                        "url": str(resp.url),
-                        "remaining": remaining,
-                        "used": used,
-                    }
+            if resp.status != 200:
+                text = await resp.text()
+                return {
+                    "error": f"Odds fetch failed: {resp.status}",
+                    "detail": text[:500],
+                    "url": str(resp.url),
+                    "remaining": remaining,
+                    "used": used,
+                }
                 
-                data = await resp.json()
+            data = await _read_json(resp)
             
-            return {
-                "success": True,
-                "event": event,
-                "bookmakers_count": len(data.get("bookmakers", [])),
-                "bookmakers": [b["key"] for b in data.get("bookmakers", [])],
-                "sample_data": data,
-                "api_remaining": remaining,
-                "api_used": used,
-            }
-        except Exception as e:
-            import traceback
-            return {"error": str(e), "traceback": traceback.format_exc()}
+        return {
+            "success": True,
+            "event": event,
+            "bookmakers_count": len(data.get("bookmakers", [])),
+            "bookmakers": [b["key"] for b in data.get("bookmakers", [])],
+            "sample_data": data,
+            "api_remaining": remaining,
+            "api_used": used,
+        }
+    except Exception as e:
+        import traceback
+        return {"error": str(e), "traceback": traceback.format_exc()}
 
 
 @app.get("/api/debug/ev-calc", dependencies=[Depends(require_admin_key)])
 async def debug_ev_calc(sport: str = Query("nba")):
     """Debug endpoint to show EV calculations for all matched props."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            # Get props
-            pp_props = await fetch_prizepicks(session, sport)
-            all_props = pp_props
+    session = app.state.session
+    try:
+        # Get props
+        pp_props = await fetch_prizepicks(session, sport)
+        all_props = pp_props
             
-            if not all_props:
-                return {"error": "No props found"}
+        if not all_props:
+            return {"error": "No props found"}
             
-            # Get first market
-            markets_needed = set()
-            for prop in all_props:
-                market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
-                if market:
-                    markets_needed.add(market)
+        # Get first market
+        markets_needed = set()
+        for prop in all_props:
+            market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
+            if market:
+                markets_needed.add(market)
             
-            if not markets_needed:
-                return {"error": "No mappable markets"}
+        if not markets_needed:
+            return {"error": "No mappable markets"}
             
-            # Get sharp odds for prioritized markets
-            all_odds = []
-            priority = MARKET_PRIORITY_BY_SPORT.get(sport.lower(), [])
-            ordered_markets = [m for m in priority if m in markets_needed]
-            ordered_markets.extend([m for m in markets_needed if m not in ordered_markets])
-            for market in ordered_markets[:4]:
-                odds = await fetch_sharp_odds(session, sport, market)
-                all_odds.extend(odds)
+        # Get sharp odds for prioritized markets in one batched request
+        priority = MARKET_PRIORITY_BY_SPORT.get(sport.lower(), [])
+        ordered_markets = [m for m in priority if m in markets_needed]
+        ordered_markets.extend([m for m in markets_needed if m not in ordered_markets])
+        all_odds = await fetch_sharp_odds(session, sport, ",".join(ordered_markets[:4]))
             
-            if not all_odds:
-                return {"error": "No sharp odds found"}
+        if not all_odds:
+            return {"error": "No sharp odds found"}
             
-            # Calculate EV for each matched prop
-            results = []
-            for prop in all_props[:50]:  # Limit to first 50
-                market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
-                if not market:
-                    continue
+        # Calculate EV for each matched prop
+        results = []
+        for prop in all_props[:50]:  # Limit to first 50
+            market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
+            if not market:
+                continue
                 
-                relevant_odds = [o for o in all_odds if o["market"] == market]
-                matched_name = match_player(prop.player_name, [o["player"] for o in relevant_odds])
+            relevant_odds = [o for o in all_odds if o["market"] == market]
+            matched_name = match_player(prop.player_name, [o["player"] for o in relevant_odds])
                 
-                if not matched_name:
-                    continue
+            if not matched_name:
+                continue
                 
-                for odds in relevant_odds:
-                    if odds["player"] != matched_name:
-                        continue
-                    if abs(odds["line"] - prop.line) > 0.5:
-                        continue
+            for odds in relevant_odds:
+                if odds["player"] != matched_name:
+                    continue
+                if abs(odds["line"] - prop.line) > 0.5:
+                    continue
                     
-                    over_prob, under_prob = calculate_no_vig(odds["over_odds"], odds["under_odds"])
-                    win_prob = max(over_prob, under_prob)
-                    recommended = "OVER" if over_prob > under_prob else "UNDER"
+                over_prob, under_prob = calculate_no_vig(odds["over_odds"], odds["under_odds"])
+                win_prob = max(over_prob, under_prob)
+                recommended = "OVER" if over_prob > under_prob else "UNDER"
                     
-                    default_be = BREAKEVEN.get(prop.platform, {}).get("default", 54.34)
-                    ev_pct = win_prob - default_be
+                default_be = PLATFORM_DEFAULT_BE.get(prop.platform, 54.34)
+                ev_pct = win_prob - default_be
                     
-                    results.append({
-                        "player": prop.player_name,
-                        "stat": prop.stat_type,
-                        "prop_line": prop.line,
-                        "book_line": odds["line"],
-                        "over_odds": odds["over_odds"],
-                        "under_odds": odds["under_odds"],
-                        "over_prob": round(over_prob, 2),
-                        "under_prob": round(under_prob, 2),
-                        "win_prob": round(win_prob, 2),
-                        "ev_pct": round(ev_pct, 2),
-                        "recommended": recommended,
-                        "would_pass_54": win_prob >= 54,
-                        "would_pass_52": win_prob >= 52,
-                    })
-                    break
+                results.append({
+                    "player": prop.player_name,
+                    "stat": prop.stat_type,
+                    "prop_line": prop.line,
+                    "book_line": odds["line"],
+                    "over_odds": odds["over_odds"],
+                    "under_odds": odds["under_odds"],
+                    "over_prob": round(over_prob, 2),
+                    "under_prob": round(under_prob, 2),
+                    "win_prob": round(win_prob, 2),
+                    "ev_pct": round(ev_pct, 2),
+                    "recommended": recommended,
+                    "would_pass_54": win_prob >= 54,
+                    "would_pass_52": win_prob >= 52,
+                })
+                break
             
-            # Sort by EV descending
-            results.sort(key=lambda x: x["ev_pct"], reverse=True)
+        # Sort by EV descending
+        results.sort(key=lambda x: x["ev_pct"], reverse=True)
             
-            return {
-                "total_props": len(all_props),
-                "total_calculated": len(results),
-                "passing_54": len([r for r in results if r["would_pass_54"]]),
-                "passing_52": len([r for r in results if r["would_pass_52"]]),
-                "best_plays": results[:15],
-            }
-        except Exception as e:
-            import traceback
-            return {"error": str(e), "traceback": traceback.format_exc()}
+        return {
+            "total_props": len(all_props),
+            "total_calculated": len(results),
+            "passing_54": len([r for r in results if r["would_pass_54"]]),
+            "passing_52": len([r for r in results if r["would_pass_52"]]),
+            "best_plays": results[:15],
+        }
+    except Exception as e:
+        import traceback
+        return {"error": str(e), "traceback": traceback.format_exc()}
 
 
 @app.get("/api/debug/ev-matching", dependencies=[Depends(require_admin_key)])
 async def debug_ev_matching(sport: str = Query("nba")):
     """Debug endpoint to test EV matching logic."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            # Get props
-            pp_props = await fetch_prizepicks(session, sport)
-            ud_props = await fetch_underdog(session, sport)
-            all_props = pp_props + ud_props
+    session = app.state.session
+    try:
+        # Get props
+        pp_props, ud_props = await asyncio.gather(
+            fetch_prizepicks(session, sport),
+            fetch_underdog(session, sport),
+        )
+        all_props = pp_props + ud_props
             
-            if not all_props:
-                return {"error": "No props found", "prizepicks": len(pp_props), "underdog": len(ud_props)}
+        if not all_props:
+            return {"error": "No props found", "prizepicks": len(pp_props), "underdog": len(ud_props)}
             
-            # Get markets needed
-            markets_needed = {}
-            for prop in all_props:
-                market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
-                if market:
-                    if market not in markets_needed:
-                        markets_needed[market] = []
-                    markets_needed[market].append({
-                        "player": prop.player_name,
-                        "line": prop.line,
-                        "stat": prop.stat_type,
-                        "platform": prop.platform,
-                    })
+        # Get markets needed
+        markets_needed = {}
+        for prop in all_props:
+            market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
+            if market:
+                if market not in markets_needed:
+                    markets_needed[market] = []
+                markets_needed[market].append({
+                    "player": prop.player_name,
+                    "line": prop.line,
+                    "stat": prop.stat_type,
+                    "platform": prop.platform,
+                })
             
-            # Get sharp odds for first market
-            first_market = list(markets_needed.keys())[0] if markets_needed else None
-            if not first_market:
-                return {"error": "No mappable markets found", "stat_types": [p.stat_type for p in all_props[:10]]}
+        # Get sharp odds for first market
+        first_market = list(markets_needed.keys())[0] if markets_needed else None
+        if not first_market:
+            return {"error": "No mappable markets found", "stat_types": [p.stat_type for p in all_props[:10]]}
             
-            all_odds = await fetch_sharp_odds(session, sport, first_market)
+        all_odds = await fetch_sharp_odds(session, sport, first_market)
             
-            # Try to match
-            matches = []
-            no_matches = []
+        # Try to match
+        matches = []
+        no_matches = []
             
-            for prop in all_props:
-                market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
-                if market != first_market:
-                    continue
+        for prop in all_props:
+            market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
+            if market != first_market:
+                continue
                 
-                relevant_odds = [o for o in all_odds if o["market"] == market]
-                odds_players = [o["player"] for o in relevant_odds]
-                matched_name = match_player(prop.player_name, odds_players)
+            relevant_odds = [o for o in all_odds if o["market"] == market]
+            odds_players = [o["player"] for o in relevant_odds]
+            matched_name = match_player(prop.player_name, odds_players)
                 
-                if matched_name:
-                    # Find the matching odds
-                    for odds in relevant_odds:
-                        if odds["player"] == matched_name:
-                            line_diff = abs(odds["line"] - prop.line)
-                            matches.append({
-                                "prop_player": prop.player_name,
-                                "prop_line": prop.line,
-                                "odds_player": matched_name,
-                                "odds_line": odds["line"],
-                                "line_diff": line_diff,
-                                "would_match": line_diff <= 0.5,
-                            })
-                            break
-                else:
-                    no_matches.append({
-                        "prop_player": prop.player_name,
-                        "prop_line": prop.line,
-                        "available_odds_players": odds_players[:10],
-                    })
+            if matched_name:
+                # Find the matching odds
+                for odds in relevant_odds:
+                    if odds["player"] == matched_name:
+                        line_diff = abs(odds["line"] - prop.line)
+                        matches.append({
+                            "prop_player": prop.player_name,
+                            "prop_line": prop.line,
+                            "odds_player": matched_name,
+                            "odds_line": odds["line"],
+                            "line_diff": line_diff,
+                            "would_match": line_diff <= 0.5,
+                        })
+                        break
+            else:
+                no_matches.append({
+                    "prop_player": prop.player_name,
+                    "prop_line": prop.line,
+                    "available_odds_players": odds_players[:10],
+                })
             
-            return {
-                "total_props": len(all_props),
-                "market_tested": first_market,
-                "sharp_odds_count": len(all_odds),
-                "matches": matches[:15],
-                "no_matches": no_matches[:10],
-                "markets_needed": {k: len(v) for k, v in markets_needed.items()},
-            }
-        except Exception as e:
-            import traceback
-            return {"error": str(e), "traceback": traceback.format_exc()}
+        return {
+            "total_props": len(all_props),
+            "market_tested": first_market,
+            "sharp_odds_count": len(all_odds),
+            "matches": matches[:15],
+            "no_matches": no_matches[:10],
+            "markets_needed": {k: len(v) for k, v in markets_needed.items()},
+        }
+    except Exception as e:
+        import traceback
+        return {"error": str(e), "traceback": traceback.format_exc()}
 
 
 @app.get("/api/cache")
@@ -2377,47 +2735,57 @@ async def set_specific_key(key_index: int):
 @app.get("/api/all-keys-usage", dependencies=[Depends(require_admin_key)])
 async def get_all_keys_usage():
     """Check usage for ALL API keys."""
-    results = []
-    
-    async with aiohttp.ClientSession() as session:
-        for i, key in enumerate(api_key_manager.keys):
-            try:
-                url = "https://api.the-odds-api.com/v4/sports"
+    cached, _ = cache.get("all_keys_usage")
+    if cached is not None:
+        return cached
+
+    session = app.state.session
+    sem = asyncio.Semaphore(8)
+
+    async def check_key(i: int, key: str) -> dict:
+        try:
+            url = "https://api.the-odds-api.com/v4/sports"
+            async with sem:
                 async with session.get(url, params={"apiKey": key}, timeout=10) as resp:
                     if resp.status == 401:
-                        results.append({
+                        return {
                             "key_number": i + 1,
                             "key_preview": f"{key[:6]}...{key[-4:]}",
                             "status": "invalid",
                             "requests_used": 0,
                             "requests_remaining": 0,
-                        })
-                    else:
-                        remaining = resp.headers.get("x-requests-remaining", "0")
-                        used = resp.headers.get("x-requests-used", "0")
-                        results.append({
-                            "key_number": i + 1,
-                            "key_preview": f"{key[:6]}...{key[-4:]}",
-                            "status": "active" if int(remaining) > 0 else "depleted",
-                            "requests_used": int(used) if str(used).isdigit() else 0,
-                            "requests_remaining": int(remaining) if str(remaining).isdigit() else 0,
-                        })
-            except Exception as e:
-                results.append({
-                    "key_number": i + 1,
-                    "key_preview": f"{key[:6]}...{key[-4:]}",
-                    "status": "error",
-                    "error": str(e),
-                    "requests_used": 0,
-                    "requests_remaining": 0,
-                })
-    
-    return {
+                        }
+                    remaining = resp.headers.get("x-requests-remaining", "0")
+                    used = resp.headers.get("x-requests-used", "0")
+                    return {
+                        "key_number": i + 1,
+                        "key_preview": f"{key[:6]}...{key[-4:]}",
+                        "status": "active" if int(remaining) > 0 else "depleted",
+                        "requests_used": int(used) if str(used).isdigit() else 0,
+                        "requests_remaining": int(remaining) if str(remaining).isdigit() else 0,
+                    }
+        except Exception as e:
+            return {
+                "key_number": i + 1,
+                "key_preview": f"{key[:6]}...{key[-4:]}",
+                "status": "error",
+                "error": str(e),
+                "requests_used": 0,
+                "requests_remaining": 0,
+            }
+
+    results = await asyncio.gather(
+        *(check_key(i, key) for i, key in enumerate(api_key_manager.keys))
+    )
+
+    payload = {
         "current_key": api_key_manager.current_index + 1,
         "total_keys": len(api_key_manager.keys),
         "keys": results,
         "total_remaining": sum(k.get("requests_remaining", 0) for k in results),
     }
+    cache.set("all_keys_usage", payload, ttl=USAGE_CACHE_TTL)
+    return payload
 
 
 @app.get("/api/odds-usage")
@@ -2425,79 +2793,113 @@ async def get_odds_api_usage():
     """Check The Odds API usage/remaining requests."""
     if not get_odds_api_key():
         return {"error": "ODDS_API_KEY not configured", "configured": False}
-    
+
+    cached, _ = cache.get("odds_usage")
+    if cached is not None:
+        return cached
+
     # Make a lightweight request to check usage (sports list is free and returns headers)
-    async with aiohttp.ClientSession() as session:
-        try:
-            url = "https://api.the-odds-api.com/v4/sports"
-            async with session.get(url, params={"apiKey": get_odds_api_key()}) as resp:
-                if resp.status == 401:
-                    # Try rotating to next key
-                    if api_key_manager.rotate_key():
-                        return {"error": "Invalid API key, rotated to next key. Refresh to check.", "configured": True}
-                    return {"error": "Invalid API key", "configured": True}
-                
-                # Extract usage from headers
-                requests_remaining = resp.headers.get("x-requests-remaining", "unknown")
-                requests_used = resp.headers.get("x-requests-used", "unknown")
+    session = app.state.session
+    try:
+        url = "https://api.the-odds-api.com/v4/sports"
+        async with session.get(url, params={"apiKey": get_odds_api_key()}) as resp:
+            if resp.status == 401:
+                # Try rotating to next key
+                if api_key_manager.rotate_key():
+                    return {"error": "Invalid API key, rotated to next key. Refresh to check.", "configured": True}
+                return {"error": "Invalid API key", "configured": True}
                 
-                remaining = int(requests_remaining) if str(requests_remaining).isdigit() else 0
-                used = int(requests_used) if str(requests_used).isdigit() else 0
+            # Extract usage from headers
+            requests_remaining = resp.headers.get("x-requests-remaining", "unknown")
+            requests_used = resp.headers.get("x-requests-used", "unknown")
                 
-                # Update the key manager with usage info (triggers auto-rotation if low)
-                api_key_manager.update_usage(remaining, used)
+            remaining = int(requests_remaining) if str(requests_remaining).isdigit() else 0
+            used = int(requests_used) if str(requests_used).isdigit() else 0
                 
-                key_status = api_key_manager.get_status()
+            # Update the key manager with usage info (triggers auto-rotation if low)
+            api_key_manager.update_usage(remaining, used)
                 
-                return {
-                    "configured": True,
-                    "requests_used": used,
-                    "requests_remaining": remaining,
-                    "requests_total": 500,  # Free tier limit per key
-                    "auto_rotation": {
-                        "enabled": key_status["total_keys"] > 1,
-                        "total_keys": key_status["total_keys"],
-                        "current_key": key_status["current_key_index"],
-                    }
+            key_status = api_key_manager.get_status()
+
+            payload = {
+                "configured": True,
+                "requests_used": used,
+                "requests_remaining": remaining,
+                "requests_total": 500,  # Free tier limit per key
+                "auto_rotation": {
+                    "enabled": key_status["total_keys"] > 1,
+                    "total_keys": key_status["total_keys"],
+                    "current_key": key_status["current_key_index"],
                 }
-        except Exception as e:
-            return {"error": str(e), "configured": True}
+            }
+            cache.set("odds_usage", payload, ttl=USAGE_CACHE_TTL)
+            return payload
+    except Exception as e:
+        return {"error": str(e), "configured": True}
 
 
 @app.get("/api/props")
 async def get_props(
+    request: Request,
     sport: str = Query("nba", description="Sport to fetch (nba, nfl, mlb, nhl, all)"),
     platform: Optional[str] = Query(None, description="Filter by platform"),
     stat: Optional[str] = Query(None, description="Filter by stat type"),
     min_ev: Optional[float] = Query(None, description="Minimum EV percentage"),
     player: Optional[str] = Query(None, description="Search by player name"),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Pagination offset"),
     refresh: bool = Query(False, description="Force refresh (bypass cache)"),
     x_admin_key: Optional[str] = Header(None),
     x_hermes_key: Optional[str] = Header(None),
 ):
-    """Get all props across platforms with optional filters."""
+    """Get all props across platforms with optional filters and pagination."""
     require_refresh_authorization(refresh, x_admin_key, x_hermes_key)
-    async with aiohttp.ClientSession() as session:
-        all_props, cache_fresh = await collect_props(session, sport, refresh=refresh)
-
-    if platform:
-        all_props = [prop for prop in all_props if prop.platform == platform.lower()]
-    if stat:
-        all_props = [prop for prop in all_props if stat.lower() in prop.stat_type.lower()]
-    if player:
+    session = app.state.session
+    all_props, cache_fresh = await collect_props(session, sport, refresh=refresh)
+
+    # One fused pass instead of a rebuilt list per filter; the steady-state
+    # cache-hit path walks thousands of props per request.
+    if platform or stat or player:
+        platform_query = platform.lower() if platform else None
+        stat_query = stat.lower() if stat else None
+        player_query = player.lower() if player else None
         all_props = [
             prop
             for prop in all_props
-            if fuzz.partial_ratio(player.lower(), prop.player_name.lower()) >= 70
+            if (platform_query is None or prop.platform == platform_query)
+            and (stat_query is None or stat_query in prop.stat_type_norm)
+            and (
+                player_query is None
+                or fuzz.partial_ratio(player_query, prop.player_name_norm) >= 70
+            )
         ]
 
-    return {
-        "count": len(all_props),
-        "sport": sport.upper(),
-        "cached": not refresh,
-        "cache_fresh": cache_fresh,
-        "props": [prop.model_dump() for prop in all_props],
-    }
+    # Slice before serializing so only the requested page is materialized.
+    total = len(all_props)
+    stop = offset + limit if limit is not None else None
+
+    # Unfiltered pages can reuse the dicts dumped when the board was cached
+    # instead of re-running model_dump per request.
+    page = None
+    if not (platform or stat or player):
+        dumped, _ = cache.get(f"props_dump_{sport.lower()}")
+        if dumped is not None and len(dumped) == total:
+            page = dumped[offset:stop]
+    if page is None:
+        page = [prop.model_dump() for prop in all_props[offset:stop]]
+
+    return cacheable_response(
+        {
+            "count": len(page),
+            "total": total,
+            "offset": offset,
+            "sport": sport.upper(),
+            "cached": not refresh,
+            "cache_fresh": cache_fresh,
+            "props": page,
+        },
+        request,
+    )
 
 
 @app.get("/api/ev")
@@ -2510,10 +2912,14 @@ async def get_ev_plays(
     refresh: bool = Query(False, description="Force refresh (bypass cache)"),
     x_admin_key: Optional[str] = Header(None),
     x_hermes_key: Optional[str] = Header(None),
+    request: Request = None,
 ):
     """Get +EV plays with sharp odds analysis. Prioritizes DraftKings/FanDuel lines."""
     require_refresh_authorization(refresh, x_admin_key, x_hermes_key)
-    cache_key = f"ev_{sport.lower()}"
+    sport_l = sport.lower()
+    platform_l = platform.lower() if platform else None
+    sport_label = "ALL" if sport_l == "all" else sport.upper()
+    cache_key = f"ev_{sport_l}"
     
     # Check cache first (unless refresh requested)
     if not refresh:
@@ -2522,7 +2928,7 @@ async def get_ev_plays(
             # Apply filters to cached data
             ev_plays = cached_data
             if platform:
-                ev_plays = [p for p in ev_plays if p["prop"]["platform"] == platform.lower()]
+                ev_plays = [p for p in ev_plays if p["prop"]["platform"] == platform_l]
             ev_plays = [
                 p
                 for p in ev_plays
@@ -2531,14 +2937,17 @@ async def get_ev_plays(
                 and p.get("consensus", {}).get("book_count", 1) >= min_books
             ]
             
-            return {
-                "count": len(ev_plays),
-                "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-                "sharp_books_used": list(set(p["sharp_odds"]["bookmaker"] for p in ev_plays)) if ev_plays else [],
-                "plays": ev_plays,
-                "cached": True,
-                "cache_fresh": is_fresh,
-            }
+            return cacheable_response(
+                {
+                    "count": len(ev_plays),
+                    "sport": sport_label,
+                    "sharp_books_used": list(dict.fromkeys(p["sharp_odds"]["bookmaker"] for p in ev_plays)),
+                    "plays": ev_plays,
+                    "cached": True,
+                    "cache_fresh": is_fresh,
+                },
+                request,
+            )
 
         latest = store.latest_run("ev", sport)
         if latest is not None:
@@ -2546,9 +2955,9 @@ async def get_ev_plays(
             max_age = int(os.getenv("PUBLIC_EV_MAX_AGE_MINUTES", "15")) * 60
             if (datetime.now(timezone.utc) - captured_at).total_seconds() <= max_age:
                 ev_plays = latest["payload"].get("plays", [])
-                cache.set(cache_key, ev_plays)
+                cache.set(cache_key, ev_plays, ttl=EV_CACHE_TTL)
                 if platform:
-                    ev_plays = [p for p in ev_plays if p["prop"]["platform"] == platform.lower()]
+                    ev_plays = [p for p in ev_plays if p["prop"]["platform"] == platform_l]
                 ev_plays = [
                     p
                     for p in ev_plays
@@ -2556,80 +2965,137 @@ async def get_ev_plays(
                     and p["win_probability"] >= min_win
                     and p.get("consensus", {}).get("book_count", 1) >= min_books
                 ]
-                return {
+                return cacheable_response(
+                    {
+                        "count": len(ev_plays),
+                        "sport": sport_label,
+                        "sharp_books_used": sorted(
+                            {p["sharp_odds"]["bookmaker"] for p in ev_plays}
+                        ),
+                        "plays": ev_plays,
+                        "cached": True,
+                        "cache_fresh": False,
+                        "captured_at": latest["captured_at"],
+                    },
+                    request,
+                )
+
+        return cacheable_response(
+            {
+                "count": 0,
+                "sport": sport_label,
+                "sharp_books_used": [],
+                "plays": [],
+                "cached": True,
+                "cache_fresh": False,
+                "message": "No scan snapshot is available yet",
+            },
+            request,
+        )
+    
+    session = app.state.session
+    # Forced refreshes are single-flight: concurrent authorized refreshes of
+    # the same sport would each fan out to the Odds API and recompute the
+    # pipeline; the lock lets one do the work while the rest wait and serve
+    # the result it cached.
+    async with refresh_locks[cache_key]:
+        cached_data, is_fresh = cache.get(cache_key)
+        if cached_data is not None and is_fresh:
+            ev_plays = cached_data
+            if platform:
+                ev_plays = [p for p in ev_plays if p["prop"]["platform"] == platform_l]
+            ev_plays = [
+                p
+                for p in ev_plays
+                if p["ev_percentage"] >= min_ev
+                and p["win_probability"] >= min_win
+                and p.get("consensus", {}).get("book_count", 1) >= min_books
+            ]
+            return cacheable_response(
+                {
                     "count": len(ev_plays),
-                    "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-                    "sharp_books_used": sorted(
-                        {p["sharp_odds"]["bookmaker"] for p in ev_plays}
-                    ),
+                    "sport": sport_label,
+                    "sharp_books_used": list(dict.fromkeys(p["sharp_odds"]["bookmaker"] for p in ev_plays)),
                     "plays": ev_plays,
                     "cached": True,
-                    "cache_fresh": False,
-                    "captured_at": latest["captured_at"],
-                }
+                    "cache_fresh": True,
+                },
+                request,
+            )
 
-        return {
-            "count": 0,
-            "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-            "sharp_books_used": [],
-            "plays": [],
-            "cached": True,
-            "cache_fresh": False,
-            "message": "No scan snapshot is available yet",
-        }
-    
-    async with aiohttp.ClientSession() as session:
         # Determine which sports to fetch
-        sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
+        sports_to_fetch = MAIN_SPORTS if sport_l == "all" else [sport_l]
         
         # Reuse the canonical prop snapshot. A forced EV refresh also refreshes props.
         all_props, _ = await collect_props(session, sport, refresh=refresh)
         
         if platform:
-            all_props = [p for p in all_props if p.platform == platform.lower()]
+            all_props = [p for p in all_props if p.platform == platform_l]
         
-        if not all_props:
-            return {"count": 0, "plays": [], "sharp_books_used": []}
-        
-        # Get exact market/event pairs needed by the fetched props.
-        markets_by_sport: dict[str, set[str]] = {}
-        events_by_sport_market: dict[tuple[str, str], set[str]] = defaultdict(set)
-        times_by_sport_market: dict[tuple[str, str], set[str]] = defaultdict(set)
+        # Drop props with no sharp-market mapping up front so the matching
+        # matrix and indexes are sized to props that can actually be scored,
+        # resolving each prop's market exactly once.
+        mapped_props: list[Prop] = []
+        prop_markets: list[str] = []
         for prop in all_props:
             market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
             if market:
-                if prop.sport not in markets_by_sport:
-                    markets_by_sport[prop.sport] = set()
-                markets_by_sport[prop.sport].add(market)
-                if prop.event_id:
-                    events_by_sport_market[(prop.sport, market)].add(prop.event_id)
-                elif prop.game_time:
-                    times_by_sport_market[(prop.sport, market)].add(prop.game_time)
-        
-        # Fetch only markets and events represented by platform props.
-        all_odds = []
+                mapped_props.append(prop)
+                prop_markets.append(market)
+        all_props = mapped_props
+
+        if not all_props:
+            return cacheable_response(
+                {"count": 0, "plays": [], "sharp_books_used": []},
+                request,
+            )
+
+        # Count how many props need each (sport, market) pair and collect the
+        # exact event IDs/times represented by them.
+        markets_by_sport: dict[str, Counter[str]] = defaultdict(Counter)
+        events_by_sport_market: dict[tuple[str, str], set[str]] = defaultdict(set)
+        times_by_sport_market: dict[tuple[str, str], set[str]] = defaultdict(set)
+        for prop, market in zip(all_props, prop_markets):
+            markets_by_sport[prop.sport][market] += 1
+            if prop.event_id:
+                events_by_sport_market[(prop.sport, market)].add(prop.event_id)
+            elif prop.game_time:
+                times_by_sport_market[(prop.sport, market)].add(prop.game_time)
+
+        # Spend the per-sport market budget on the highest-coverage markets and
+        # batch them into one comma-separated request per sport: The Odds API
+        # prices all listed markets per event call, so this divides quota spend
+        # by the market count. The sports themselves run through one gather.
+        sport_fetches: list[tuple[str, str, set[str] | None, set[str] | None]] = []
         for s in sports_to_fetch:
-            sport_markets = markets_by_sport.get(s.upper(), set())
-            priority = MARKET_PRIORITY_BY_SPORT.get(s.lower(), [])
-            ordered_markets = [m for m in priority if m in sport_markets]
-            ordered_markets.extend([m for m in sport_markets if m not in ordered_markets])
-            tasks = [
+            market_counts = markets_by_sport.get(s.upper())
+            if not market_counts:
+                continue
+            top_markets = [
+                market for market, _ in market_counts.most_common(SHARP_MARKET_LIMIT)
+            ]
+            event_ids: set[str] = set()
+            commence_times: set[str] = set()
+            for market in top_markets:
+                event_ids |= events_by_sport_market.get((s.upper(), market), set())
+                commence_times |= times_by_sport_market.get((s.upper(), market), set())
+            sport_fetches.append(
+                (s, ",".join(top_markets), event_ids or None, commence_times or None)
+            )
+        odds_lists = await asyncio.gather(
+            *[
                 fetch_sharp_odds(
-                    session,
-                    s,
-                    market,
-                    events_by_sport_market.get((s.upper(), market)) or None,
-                    times_by_sport_market.get((s.upper(), market)) or None,
+                    session, s, markets, event_ids, commence_times, refresh=refresh
                 )
-                for market in ordered_markets[:SHARP_MARKET_LIMIT]
+                for s, markets, event_ids, commence_times in sport_fetches
             ]
-            for odds in await asyncio.gather(*tasks):
-                all_odds.extend(odds)
+        )
+        all_odds = [row for rows in odds_lists for row in rows]
         
         if not all_odds:
             response = {
                 "count": 0,
-                "sport": "ALL" if sport.lower() == "all" else sport.upper(),
+                "sport": sport_label,
                 "plays": [],
                 "sharp_books_used": [],
                 "error": "Could not fetch sportsbook odds",
@@ -2642,31 +3108,83 @@ async def get_ev_plays(
                 {"props": len(all_props), "odds": 0},
                 response["error"],
             )
-            return response
+            return cacheable_response(response, request)
         
+        # Index odds rows by (market, normalized player) once, then score every
+        # prop against the unique names per market in one C-level cdist pass.
+        odds_index: dict[tuple[str, str], list[dict]] = defaultdict(list)
+        name_columns: dict[str, int] = {}
+        unique_names: list[str] = []
+        columns_by_market: dict[str, dict[str, int]] = defaultdict(dict)
+        for row in all_odds:
+            name_norm = normalize_player_name(row["player"])
+            odds_index[(row["market"], name_norm)].append(row)
+            column = name_columns.setdefault(name_norm, len(unique_names))
+            if column == len(unique_names):
+                unique_names.append(name_norm)
+            columns_by_market[row["market"]].setdefault(name_norm, column)
+        # Sort each bucket by line (sharp books first within a line) so the
+        # exact-line rows for a prop come from a bisect window, not a scan.
+        bucket_lines: dict[tuple[str, str], list[float]] = {}
+        for bucket_key, rows in odds_index.items():
+            rows.sort(key=lambda row: (row["line"], 0 if row.get("is_sharp") else 1))
+            bucket_lines[bucket_key] = [row["line"] for row in rows]
+        score_matrix = process.cdist(
+            [prop.player_name_norm for prop in all_props],
+            unique_names,
+            scorer=fuzz.WRatio,
+            score_cutoff=80,
+            workers=-1,
+            dtype=np.uint8,
+        )
+
         # Analyze each prop
         ev_plays = []
-        
-        for prop in all_props:
-            market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
-            if not market:
+
+        for prop_index, prop in enumerate(all_props):
+            market = prop_markets[prop_index]
+
+            market_columns = columns_by_market.get(market)
+            if not market_columns:
                 continue
-            
-            relevant_odds = [
+
+            # Pick the best-scoring name whose rows pass the event filter;
+            # a zero score means everything was below the cutoff.
+            row_scores = score_matrix[prop_index]
+            matched_norm = None
+            best_score = 0
+            for name_norm, column in market_columns.items():
+                score = row_scores[column]
+                if score <= best_score:
+                    continue
+                if prop.event_id and not any(
+                    row.get("event_id") == prop.event_id
+                    for row in odds_index[(market, name_norm)]
+                ):
+                    continue
+                best_score = score
+                matched_norm = name_norm
+            if matched_norm is None:
+                continue
+
+            bucket = odds_index[(market, matched_norm)]
+            player_odds = [
                 row
-                for row in all_odds
-                if row["market"] == market
-                and (not prop.event_id or row.get("event_id") == prop.event_id)
+                for row in bucket
+                if not prop.event_id or row.get("event_id") == prop.event_id
             ]
-            relevant_odds.sort(key=lambda x: 0 if x.get("is_sharp") else 1)
-            
-            matched_name = match_player(prop.player_name, [o["player"] for o in relevant_odds])
-            
-            if not matched_name:
-                continue
-            
-            player_odds = [row for row in relevant_odds if row["player"] == matched_name]
-            consensus = build_consensus(prop, player_odds)
+            player_odds.sort(key=lambda x: 0 if x.get("is_sharp") else 1)
+
+            lines = bucket_lines[(market, matched_norm)]
+            low = bisect.bisect_left(lines, prop.line - 0.001)
+            high = bisect.bisect_right(lines, prop.line + 0.001)
+            exact_rows = [
+                row
+                for row in bucket[low:high]
+                if not prop.event_id or row.get("event_id") == prop.event_id
+            ]
+            exact_rows.sort(key=lambda x: 0 if x.get("is_sharp") else 1)
+            consensus = build_consensus(prop, exact_rows)
             if consensus is None:
                 continue
 
@@ -2675,7 +3193,7 @@ async def get_ev_plays(
             recommended = consensus["recommended_play"]
             win_prob = consensus["win_probability"]
             
-            default_be = BREAKEVEN.get(prop.platform, {}).get("default", 54.34)
+            default_be = PLATFORM_DEFAULT_BE.get(prop.platform, 54.34)
             ev_pct = win_prob - default_be
             
             candidate_id = _safe_id(
@@ -2726,12 +3244,12 @@ async def get_ev_plays(
         ev_plays.sort(key=lambda x: x["ev_percentage"], reverse=True)
         
         # Cache the unfiltered results
-        cache.set(cache_key, ev_plays)
+        cache.set(cache_key, ev_plays, ttl=EV_CACHE_TTL)
         
         # Apply filters for response
         filtered_plays = ev_plays
         if platform:
-            filtered_plays = [p for p in filtered_plays if p["prop"]["platform"] == platform.lower()]
+            filtered_plays = [p for p in filtered_plays if p["prop"]["platform"] == platform_l]
         filtered_plays = [
             p
             for p in filtered_plays
@@ -2742,8 +3260,8 @@ async def get_ev_plays(
         
         response = {
             "count": len(filtered_plays),
-            "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-            "sharp_books_used": list(set(p["sharp_odds"]["bookmaker"] for p in filtered_plays)) if filtered_plays else [],
+            "sport": sport_label,
+            "sharp_books_used": list(dict.fromkeys(p["sharp_odds"]["bookmaker"] for p in filtered_plays)),
             "plays": filtered_plays,
             "cached": False,
         }
@@ -2759,7 +3277,7 @@ async def get_ev_plays(
                 "candidates_returned": len(filtered_plays),
             },
         )
-        return response
+        return cacheable_response(response, request)
 
 
 @app.get("/api/middles")
@@ -2772,7 +3290,9 @@ async def get_middles(
 ):
     """Find middle/arbitrage opportunities across platforms."""
     require_refresh_authorization(refresh, x_admin_key, x_hermes_key)
-    cache_key = f"middles_{sport.lower()}"
+    sport_l = sport.lower()
+    sport_label = "ALL" if sport_l == "all" else sport.upper()
+    cache_key = f"middles_{sport_l}"
     
     # Check cache first (unless refresh requested)
     if not refresh:
@@ -2782,80 +3302,95 @@ async def get_middles(
             middles = [m for m in cached_data if m["spread"] >= min_spread]
             return {
                 "count": len(middles),
-                "sport": "ALL" if sport.lower() == "all" else sport.upper(),
+                "sport": sport_label,
                 "middles": middles,
                 "cached": True,
                 "cache_fresh": is_fresh,
             }
     
-    async with aiohttp.ClientSession() as session:
-        all_props, _ = await collect_props(session, sport, refresh=refresh)
-        pp_props = [prop for prop in all_props if prop.platform == "prizepicks"]
-        ud_props = [prop for prop in all_props if prop.platform == "underdog"]
-        middles = []
-
-        # Match on sport + canonical market, then fuzzy-match the player name.
-        for pp_prop in pp_props:
-            pp_market = pp_prop.market_key or market_for_stat(pp_prop.stat_type, pp_prop.sport)
-            candidates = [
-                prop
-                for prop in ud_props
-                if prop.sport == pp_prop.sport
-                and (prop.market_key or market_for_stat(prop.stat_type, prop.sport)) == pp_market
-            ]
-            matched_name = match_player(pp_prop.player_name, [prop.player_name for prop in candidates])
-            if not matched_name:
-                continue
-            ud_prop = next(prop for prop in candidates if prop.player_name == matched_name)
-            spread = abs(pp_prop.line - ud_prop.line)
-            if spread <= 0:
-                continue
+    session = app.state.session
+    all_props, _ = await collect_props(session, sport, refresh=refresh)
+    pp_props = [prop for prop in all_props if prop.platform == "prizepicks"]
+    ud_props = [prop for prop in all_props if prop.platform == "underdog"]
+    middles = []
+
+    # Group Underdog props by (sport, market) once so each PrizePicks prop
+    # only scores its own bucket, using the normalized names cached on the
+    # model instead of re-lowercasing per comparison.
+    ud_by_group: dict[tuple[str, str | None], list[Prop]] = defaultdict(list)
+    for prop in ud_props:
+        ud_market = prop.market_key or market_for_stat(prop.stat_type, prop.sport)
+        ud_by_group[(prop.sport, ud_market)].append(prop)
+    ud_names_by_group = {
+        group: [prop.player_name_norm for prop in bucket]
+        for group, bucket in ud_by_group.items()
+    }
 
-            if pp_prop.line > ud_prop.line:
-                high_platform, high_line = "prizepicks", pp_prop.line
-                low_platform, low_line = "underdog", ud_prop.line
-            else:
-                high_platform, high_line = "underdog", ud_prop.line
-                low_platform, low_line = "prizepicks", pp_prop.line
-
-            middle_zone = []
-            current = low_line + 0.5
-            while current < high_line:
-                middle_zone.append(round(current, 2))
-                current += 0.5
-
-            middles.append({
-                "player_name": pp_prop.player_name,
-                "stat_type": pp_prop.stat_type,
-                "sport": pp_prop.sport,
-                "platform_a": {
-                    "name": high_platform,
-                    "line": high_line,
-                    "recommended": "UNDER",
-                },
-                "platform_b": {
-                    "name": low_platform,
-                    "line": low_line,
-                    "recommended": "OVER",
-                },
-                "spread": spread,
-                "middle_zone": middle_zone,
-            })
+    # Match on sport + canonical market, then fuzzy-match the player name.
+    for pp_prop in pp_props:
+        pp_market = pp_prop.market_key or market_for_stat(pp_prop.stat_type, pp_prop.sport)
+        group = (pp_prop.sport, pp_market)
+        candidates = ud_by_group.get(group)
+        if not candidates:
+            continue
+        matched = process.extractOne(
+            pp_prop.player_name_norm,
+            ud_names_by_group[group],
+            scorer=fuzz.WRatio,
+            score_cutoff=80,
+        )
+        if not matched:
+            continue
+        ud_prop = candidates[matched[2]]
+        spread = abs(pp_prop.line - ud_prop.line)
+        if spread <= 0:
+            continue
+
+        if pp_prop.line > ud_prop.line:
+            high_platform, high_line = "prizepicks", pp_prop.line
+            low_platform, low_line = "underdog", ud_prop.line
+        else:
+            high_platform, high_line = "underdog", ud_prop.line
+            low_platform, low_line = "prizepicks", pp_prop.line
+
+        # Lines land on half-point ticks, so the zone comes from an integer
+        # range instead of accumulating float steps and rounding each one.
+        low_ticks = round(low_line * 2)
+        high_ticks = round(high_line * 2)
+        middle_zone = [tick / 2 for tick in range(low_ticks + 1, high_ticks)]
+
+        middles.append({
+            "player_name": pp_prop.player_name,
+            "stat_type": pp_prop.stat_type,
+            "sport": pp_prop.sport,
+            "platform_a": {
+                "name": high_platform,
+                "line": high_line,
+                "recommended": "UNDER",
+            },
+            "platform_b": {
+                "name": low_platform,
+                "line": low_line,
+                "recommended": "OVER",
+            },
+            "spread": spread,
+            "middle_zone": middle_zone,
+        })
         
-        middles.sort(key=lambda x: x["spread"], reverse=True)
+    middles.sort(key=lambda x: x["spread"], reverse=True)
         
-        # Cache the unfiltered results (with min_spread=0)
-        cache.set(cache_key, middles)
+    # Cache the unfiltered results (with min_spread=0)
+    cache.set(cache_key, middles, ttl=MIDDLES_CACHE_TTL)
         
-        # Apply min_spread filter for response
-        filtered_middles = [m for m in middles if m["spread"] >= min_spread]
+    # Apply min_spread filter for response
+    filtered_middles = [m for m in middles if m["spread"] >= min_spread]
         
-        return {
-            "count": len(filtered_middles),
-            "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-            "middles": filtered_middles,
-            "cached": False,
-        }
+    return {
+        "count": len(filtered_middles),
+        "sport": sport_label,
+        "middles": filtered_middles,
+        "cached": False,
+    }
 
 
 @app.get("/api/compare/{player_name}")
@@ -2864,34 +3399,36 @@ async def compare_player(
     sport: str = Query("nba", description="Sport"),
 ):
     """Compare a player's lines across all platforms."""
-    async with aiohttp.ClientSession() as session:
-        all_props, _ = await collect_props(session, sport)
+    session = app.state.session
+    all_props, _ = await collect_props(session, sport)
         
-        # Find matching player
-        matches = [p for p in all_props if fuzz.partial_ratio(player_name.lower(), p.player_name.lower()) >= 80]
+    # Find matching player
+    player_query = player_name.lower()
+    matches = [p for p in all_props if fuzz.partial_ratio(player_query, p.player_name_norm) >= 80]
         
-        if not matches:
-            return {"found": False, "player": player_name, "props": []}
+    if not matches:
+        return {"found": False, "player": player_name, "props": []}
         
-        # Group by stat type
-        by_stat = {}
-        for p in matches:
-            if p.stat_type not in by_stat:
-                by_stat[p.stat_type] = {}
-            by_stat[p.stat_type][p.platform] = p.line
+    # Group by stat type
+    by_stat = {}
+    for p in matches:
+        if p.stat_type not in by_stat:
+            by_stat[p.stat_type] = {}
+        by_stat[p.stat_type][p.platform] = p.line
         
-        return {
-            "found": True,
-            "player": matches[0].player_name,
-            "team": matches[0].team,
-            "sport": sport.upper(),
-            "by_stat": by_stat,
-            "props": [p.model_dump() for p in matches]
-        }
+    return {
+        "found": True,
+        "player": matches[0].player_name,
+        "team": matches[0].team,
+        "sport": sport.upper(),
+        "by_stat": by_stat,
+        "props": [p.model_dump() for p in matches]
+    }
 
 
 @app.get("/api/games")
 async def get_games(
+    request: Request,
     sport: Optional[str] = Query(None, description="Sport (nba, nfl, mlb, nhl) or omit for all"),
     refresh: bool = Query(False, description="Force refresh (bypass cache)"),
     x_admin_key: Optional[str] = Header(None),
@@ -2907,50 +3444,50 @@ async def get_games(
         if cached_data is not None:
             cached_data["cached"] = True
             cached_data["cache_fresh"] = is_fresh
-            return cached_data
+            return cacheable_response(cached_data, request)
     
-    async with aiohttp.ClientSession() as session:
-        normalized_sport = sport or "all"
-        all_props, _ = await collect_props(session, normalized_sport, refresh=refresh)
-        teams = set()
-        games_by_key: dict[str, dict[str, Any]] = {}
-        for prop in all_props:
-            if prop.team:
-                teams.add(prop.team)
-            game_key = prop.event_id or f"{prop.sport}|{prop.opponent}|{prop.game_time}"
-            game = games_by_key.setdefault(
-                game_key,
-                {
-                    "id": game_key,
-                    "sport": prop.sport,
-                    "matchup": prop.opponent,
-                    "start_time": prop.game_time,
-                    "prop_count": 0,
-                    "platforms": {},
-                },
-            )
-            game["prop_count"] += 1
-            game["platforms"][prop.platform] = game["platforms"].get(prop.platform, 0) + 1
-        
-        result = {
-            "sport": normalized_sport.upper(),
-            "teams_with_props": sorted(list(teams)),
-            "total_props": len(all_props),
-            "platforms": {
-                "prizepicks": sum(1 for prop in all_props if prop.platform == "prizepicks"),
-                "underdog": sum(1 for prop in all_props if prop.platform == "underdog"),
+    session = app.state.session
+    normalized_sport = sport or "all"
+    all_props, _ = await collect_props(session, normalized_sport, refresh=refresh)
+    teams = set()
+    games_by_key: dict[str, dict[str, Any]] = {}
+    for prop in all_props:
+        if prop.team:
+            teams.add(prop.team)
+        game_key = prop.event_id or f"{prop.sport}|{prop.opponent}|{prop.game_time}"
+        game = games_by_key.setdefault(
+            game_key,
+            {
+                "id": game_key,
+                "sport": prop.sport,
+                "matchup": prop.opponent,
+                "start_time": prop.game_time,
+                "prop_count": 0,
+                "platforms": {},
             },
-            "games": sorted(
-                games_by_key.values(),
-                key=lambda game: game.get("start_time") or "",
-            ),
-            "cached": False,
-        }
+        )
+        game["prop_count"] += 1
+        game["platforms"][prop.platform] = game["platforms"].get(prop.platform, 0) + 1
         
-        # Cache the result
-        cache.set(cache_key, result)
+    result = {
+        "sport": normalized_sport.upper(),
+        "teams_with_props": sorted(list(teams)),
+        "total_props": len(all_props),
+        "platforms": {
+            "prizepicks": sum(1 for prop in all_props if prop.platform == "prizepicks"),
+            "underdog": sum(1 for prop in all_props if prop.platform == "underdog"),
+        },
+        "games": sorted(
+            games_by_key.values(),
+            key=lambda game: game.get("start_time") or "",
+        ),
+        "cached": False,
+    }
         
-        return result
+    # Cache the result
+    cache.set(cache_key, result, ttl=GAMES_CACHE_TTL)
+
+    return cacheable_response(result, request)
 
 
 @app.post("/api/calc")
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 
 
 SUPPORTED_MLB_MARKETS = {
@@ -6,13 +6,18 @@ import discord
 from discord.ext import commands
 import aiohttp
 import asyncio
+import bisect
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 import os
 from dotenv import load_dotenv
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process, utils
 from datetime import datetime
-import json
+import heapq
+import orjson
+import random
 
 load_dotenv()
 
@@ -63,6 +68,13 @@ PROP_MAPPINGS = {
 BREAKEVEN_PP = {"5_flex": 54.34, "4_power": 56.23, "2_power": 57.74}
 BREAKEVEN_UD = {"5_leg": 52.38, "4_leg": 53.57, "3_leg": 55.56, "2_leg": 60.00}  # Underdog payouts differ
 
+# Win% tiers resolved by bisect instead of chained ternaries; extend by
+# inserting a threshold and its value at the matching position.
+_COLOR_THRESHOLDS = [57, 60]
+_PLAY_COLORS = [0xf97316, 0xeab308, 0x22c55e]
+_CALC_THRESHOLDS = [54.34, 56.23, 57.74]
+_CALC_RECS = ["Not +EV", "+EV for 5/6-Flex", "+EV for 4-Power+", "+EV for 2-Power+"]
+
 @dataclass
 class Prop:
     player: str
@@ -80,11 +92,68 @@ class Odds:
     under: int
     book: str
 
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+# One pooled session shared by every command instead of a fresh
+# ClientSession (and TLS handshake) per invocation, plus a shared cap on
+# concurrent Odds API calls so gathered fetches can't trip rate limits.
+_http_session: Optional[aiohttp.ClientSession] = None
+ODDS_SEM = asyncio.Semaphore(6)
+
+async def get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, limit_per_host=8, ttl_dns_cache=300)
+        )
+    return _http_session
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# Short TTL cache so command bursts (!both after !ev, repeated !player)
+# reuse upstream responses instead of re-hitting PrizePicks/Underdog and
+# burning Odds API quota. A per-key lock collapses concurrent misses into
+# one fetch; empty results (usually a failed fetch) are never cached.
+_fetch_cache: dict[str, tuple[float, Any]] = {}
+_fetch_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+PROPS_TTL = 30
+EVENTS_TTL = 60
+ODDS_TTL = 20
+
+# Transient connection failures get a couple of jittered retries instead
+# of failing the whole command; anything else is logged, not swallowed.
+_TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=8)
+
+async def _retry_sleep(attempt):
+    await asyncio.sleep(0.2 * 2**attempt + random.random() * 0.1)
+
+async def cached_fetch(key, ttl, coro_factory):
+    hit = _fetch_cache.get(key)
+    if hit and hit[0] > time.monotonic():
+        return hit[1]
+    async with _fetch_locks[key]:
+        hit = _fetch_cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        value = await coro_factory()
+        if value:
+            _fetch_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
 # =============================================================================
 # API FETCHING
 # =============================================================================
 
 async def fetch_pp(session, league):
+    """Fetch PrizePicks props (TTL-cached)."""
+    return await cached_fetch(f"pp:{league.lower()}", PROPS_TTL, lambda: _fetch_pp(session, league))
+
+async def _fetch_pp(session, league):
     """Fetch PrizePicks props"""
     league_id = LEAGUE_IDS.get(league.lower())
     if not league_id: return []
@@ -103,21 +172,31 @@ async def fetch_pp(session, league):
         "sec-fetch-mode": "cors",
         "sec-fetch-site": "same-site",
     }
-    try:
-        async with session.get(url, headers=headers) as r:
-            if r.status != 200: return []
-            data = await r.json()
-            included = {i["id"]: i for i in data.get("included", [])}
-            props = []
-            for p in data.get("data", []):
-                a = p.get("attributes", {})
-                pid = p.get("relationships", {}).get("new_player", {}).get("data", {}).get("id")
-                pl = included.get(pid, {}).get("attributes", {})
-                props.append(Prop(pl.get("name", "?"), pl.get("team", ""), a.get("stat_type", ""), float(a.get("line_score", 0)), league.upper(), "prizepicks"))
-            return props
-    except: return []
+    for attempt in range(3):
+        try:
+            async with session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT) as r:
+                if r.status != 200: return []
+                data = orjson.loads(await r.read())
+                included = {i["id"]: i for i in data.get("included", [])}
+                props = []
+                for p in data.get("data", []):
+                    a = p.get("attributes", {})
+                    pid = p.get("relationships", {}).get("new_player", {}).get("data", {}).get("id")
+                    pl = included.get(pid, {}).get("attributes", {})
+                    props.append(Prop(pl.get("name", "?"), pl.get("team", ""), a.get("stat_type", ""), float(a.get("line_score", 0)), league.upper(), "prizepicks"))
+                return props
+        except _TRANSIENT_ERRORS:
+            await _retry_sleep(attempt)
+        except Exception as e:
+            print(f"PrizePicks fetch error: {e}")
+            return []
+    return []
 
 async def fetch_ud(session, league):
+    """Fetch Underdog Fantasy props (TTL-cached)."""
+    return await cached_fetch(f"ud:{league.lower()}", PROPS_TTL, lambda: _fetch_ud(session, league))
+
+async def _fetch_ud(session, league):
     """Fetch Underdog Fantasy props"""
     sport = UD_SPORTS.get(league.lower())
     if not sport: return []
@@ -130,7 +209,7 @@ async def fetch_ud(session, league):
     try:
         async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as r:
             if r.status != 200: return []
-            data = await r.json()
+            data = orjson.loads(await r.read())
             
             props = []
             games = {g["id"]: g for g in data.get("games", [])}
@@ -171,35 +250,72 @@ async def fetch_ud(session, league):
         print(f"Underdog fetch error: {e}")
         return []
 
+async def _fetch_one_event(session, sem, sport_key, event_id, market):
+    """Fetch and parse odds for one event, bounded by the shared semaphore."""
+    data = None
+    for attempt in range(3):
+        try:
+            async with sem:
+                async with session.get(f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{event_id}/odds", params={"apiKey": ODDS_API_KEY, "regions": "us", "markets": market, "oddsFormat": "american"}, timeout=_REQUEST_TIMEOUT) as r:
+                    if r.status != 200: return []
+                    data = orjson.loads(await r.read())
+            break
+        except _TRANSIENT_ERRORS:
+            await _retry_sleep(attempt)
+    if data is None: return []
+    odds = []
+    for bk in data.get("bookmakers", []):
+        for m in bk.get("markets", []):
+            if m["key"] != market: continue
+            po = {}
+            for o in m.get("outcomes", []):
+                # One lower() per outcome and a startswith check instead
+                # of two substring scans.
+                name = o.get("name", "").lower()
+                side = "over" if name.startswith("over") else "under" if name.startswith("under") else None
+                if side: po.setdefault(o.get("description", ""), {})[side] = o
+            for pl, oo in po.items():
+                if "over" in oo and "under" in oo:
+                    odds.append(Odds(pl, oo["over"].get("point", 0), oo["over"].get("price", -110), oo["under"].get("price", -110), bk["key"]))
+    return odds
+
+async def _fetch_events(session, sport_key):
+    for attempt in range(3):
+        try:
+            async with ODDS_SEM:
+                async with session.get(f"https://api.the-odds-api.com/v4/sports/{sport_key}/events", params={"apiKey": ODDS_API_KEY}, timeout=_REQUEST_TIMEOUT) as r:
+                    if r.status != 200: return []
+                    return orjson.loads(await r.read())
+        except _TRANSIENT_ERRORS:
+            await _retry_sleep(attempt)
+    return []
+
 async def fetch_odds(session, sport, market):
-    """Fetch sportsbook odds from The Odds API"""
+    """Fetch sportsbook odds from The Odds API (TTL-cached)."""
     if not ODDS_API_KEY: return []
     sport_key = ODDS_API_SPORTS.get(sport.lower())
     if not sport_key: return []
+    return await cached_fetch(
+        f"odds:{sport_key}:{market}", ODDS_TTL, lambda: _fetch_odds(session, sport_key, market)
+    )
+
+async def _fetch_odds(session, sport_key, market):
     try:
-        async with session.get(f"https://api.the-odds-api.com/v4/sports/{sport_key}/events", params={"apiKey": ODDS_API_KEY}) as r:
-            if r.status != 200: return []
-            events = await r.json()
-        all_odds = []
-        for e in events[:8]:
-            async with session.get(f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{e['id']}/odds", params={"apiKey": ODDS_API_KEY, "regions": "us", "markets": market, "oddsFormat": "american"}) as r:
-                if r.status != 200: continue
-                data = await r.json()
-                for bk in data.get("bookmakers", []):
-                    for m in bk.get("markets", []):
-                        if m["key"] != market: continue
-                        po = {}
-                        for o in m.get("outcomes", []):
-                            pl = o.get("description", "")
-                            if pl not in po: po[pl] = {}
-                            if "over" in o.get("name", "").lower(): po[pl]["over"] = o
-                            elif "under" in o.get("name", "").lower(): po[pl]["under"] = o
-                        for pl, oo in po.items():
-                            if "over" in oo and "under" in oo:
-                                all_odds.append(Odds(pl, oo["over"].get("point", 0), oo["over"].get("price", -110), oo["under"].get("price", -110), bk["key"]))
-            await asyncio.sleep(0.3)
-        return all_odds
-    except: return []
+        events = await cached_fetch(
+            f"events:{sport_key}", EVENTS_TTL, lambda: _fetch_events(session, sport_key)
+        )
+        if not events: return []
+        # One wave of bounded-concurrency event calls instead of serial
+        # awaits with a sleep between each; the shared semaphore keeps us
+        # under the Odds API rate limit.
+        results = await asyncio.gather(
+            *(_fetch_one_event(session, ODDS_SEM, sport_key, e["id"], market) for e in events[:8]),
+            return_exceptions=True,
+        )
+        return [o for r in results if not isinstance(r, BaseException) for o in r]
+    except Exception as e:
+        print(f"Odds fetch error: {e}")
+        return []
 
 # =============================================================================
 # CALCULATIONS
@@ -212,13 +328,15 @@ def no_vig(over, under):
     return (oi/t)*100, (ui/t)*100
 
 def match(pp_name, odds_names):
-    pp = pp_name.lower().replace(" jr.", "").replace(" sr.", "").strip()
-    best, score = None, 0
-    for on in odds_names:
-        o = on.lower().replace(" jr.", "").replace(" sr.", "").strip()
-        s = max(fuzz.ratio(pp, o), fuzz.partial_ratio(pp, o), fuzz.token_sort_ratio(pp, o))
-        if s > score and s >= 80: best, score = on, s
-    return best
+    """Best fuzzy match for a DFS name among sportsbook names, or None."""
+    hit = process.extractOne(
+        pp_name,
+        odds_names,
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+        score_cutoff=80,
+    )
+    return hit[0] if hit else None
 
 # =============================================================================
 # WEBHOOK POSTING
@@ -230,11 +348,21 @@ async def post_to_webhook(session, webhook_url, content=None, embeds=None):
     payload = {}
     if content: payload["content"] = content
     if embeds: payload["embeds"] = embeds
-    try:
-        async with session.post(webhook_url, json=payload) as r:
-            return r.status in [200, 204]
-    except:
-        return False
+    for attempt in range(3):
+        try:
+            async with session.post(
+                webhook_url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=_REQUEST_TIMEOUT,
+            ) as r:
+                return r.status in [200, 204]
+        except _TRANSIENT_ERRORS:
+            await _retry_sleep(attempt)
+        except Exception as e:
+            print(f"Webhook post error: {e}")
+            return False
+    return False
 
 async def send_plays_to_webhook(session, plays, sport, source, breakeven):
     """Send +EV plays to appropriate webhook"""
@@ -245,21 +373,18 @@ async def send_plays_to_webhook(session, plays, sport, source, breakeven):
     platform = "PRIZEPICKS" if source == "prizepicks" else "UNDERDOG"
     color = 0x00ff00 if source == "prizepicks" else 0x7c3aed  # Green for PP, Purple for UD
     
-    # Header embed
-    header = {
+    # Header plus one embed per play, shipped 10 embeds per POST (the
+    # Discord webhook maximum) instead of one request per play.
+    embeds = [{
         "title": f"🎯 {platform} +EV PLAYS | {sport.upper()}",
         "description": f"**{len(plays)} plays found** • {datetime.now().strftime('%I:%M %p')}",
         "color": color
-    }
-    await post_to_webhook(session, webhook, embeds=[header])
-    await asyncio.sleep(0.5)
-    
-    # Individual play embeds
+    }]
     for p in plays[:15]:
         ev = p["win"] - breakeven
-        play_color = 0x22c55e if p["win"] >= 60 else 0xeab308 if p["win"] >= 57 else 0xf97316
-        
-        embed = {
+        play_color = _PLAY_COLORS[bisect.bisect_right(_COLOR_THRESHOLDS, p["win"])]
+
+        embeds.append({
             "title": f"{p['player']} {p['play']} {p['line']}",
             "color": play_color,
             "fields": [
@@ -270,9 +395,12 @@ async def send_plays_to_webhook(session, plays, sport, source, breakeven):
                 {"name": "Book", "value": f"`{p['book']}`", "inline": True},
                 {"name": "Odds", "value": f"O:`{p['ov']:+d}` U:`{p['un']:+d}`", "inline": True},
             ]
-        }
-        await post_to_webhook(session, webhook, embeds=[embed])
-        await asyncio.sleep(0.3)
+        })
+
+    for start in range(0, len(embeds), 10):
+        if start:
+            await asyncio.sleep(0.5)
+        await post_to_webhook(session, webhook, embeds=embeds[start:start + 10])
 
 # =============================================================================
 # ANALYSIS FUNCTIONS
@@ -295,7 +423,7 @@ async def analyze_platform(session, sport, source, fetch_func, breakeven_key):
         ) as response:
             if response.status != 200:
                 return [], f"Canonical API returned HTTP {response.status}"
-            payload = await response.json()
+            payload = orjson.loads(await response.read())
     except Exception as exc:
         return [], f"Canonical API unavailable: {exc}"
 
@@ -327,8 +455,10 @@ async def analyze_platform(session, sport, source, fetch_func, breakeven_key):
             }
         )
 
-    plays.sort(key=lambda play: play["win"], reverse=True)
-    return plays, None
+    # Every consumer shows at most 15 plays, so select the top 15 in one
+    # O(P) heap pass instead of sorting the whole list. This also keeps
+    # the "N plays" headers consistent with what actually gets posted.
+    return heapq.nlargest(15, plays, key=lambda play: play["win"]), None
 
 # =============================================================================
 # DISCORD BOT
@@ -336,7 +466,16 @@ async def analyze_platform(session, sport, source, fetch_func, breakeven_key):
 
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+class EVBot(commands.Bot):
+    async def close(self):
+        global _http_session
+        if _http_session is not None and not _http_session.closed:
+            await _http_session.close()
+            _http_session = None
+        await super().close()
+
+bot = EVBot(command_prefix="!", intents=intents)
 
 @bot.event
 async def on_ready():
@@ -352,32 +491,37 @@ async def ev(ctx, sport: str = "nba"):
         await ctx.send(f"Sports: {', '.join(LEAGUE_IDS.keys())}"); return
     await ctx.send(f"Fetching PrizePicks {sport.upper()}...")
     
-    async with aiohttp.ClientSession() as s:
-        plays, error = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
-        if error:
-            await ctx.send(error); return
-        if not plays:
-            await ctx.send("No +EV plays found"); return
+    s = await get_http_session()
+    plays, error = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
+    if error:
+        await ctx.send(error); return
+    if not plays:
+        await ctx.send("No +EV plays found"); return
         
-        # Send to channel
-        h = f"```\n{'='*72}\nPRIZEPICKS +EV | {sport.upper()} | {len(plays)} Plays\n{'='*72}\n```"
+    # Send to channel: header and table in one message (one Discord
+    # round-trip) unless the combined text would pass the 2000-char cap.
+    h = f"```\n{'='*72}\nPRIZEPICKS +EV | {sport.upper()} | {len(plays)} Plays\n{'='*72}\n```"
+
+    t = "```\n"
+    t += f"{'Team':<12} {'Bet Details':<32} {'Win%':>7} {'EV%':>7}\n"
+    t += f"{'-'*12} {'-'*32} {'-'*7} {'-'*7}\n"
+
+    for p in plays[:15]:
+        ev_pct = p["win"] - BREAKEVEN_PP["5_flex"]
+        team = p["team"][:10]
+        det = f"[{p['stat'][:8]}] {p['player'][:14]} {p['play'][0]} {p['line']}"[:30]
+        t += f"{team:<12} {det:<32} {p['win']:>5.1f}% {ev_pct:>5.2f}%\n"
+
+    t += "```"
+    msg = h + "\n" + t
+    if len(msg) <= 2000:
+        await ctx.send(msg)
+    else:
         await ctx.send(h)
-        
-        t = "```\n"
-        t += f"{'Team':<12} {'Bet Details':<32} {'Win%':>7} {'EV%':>7}\n"
-        t += f"{'-'*12} {'-'*32} {'-'*7} {'-'*7}\n"
-        
-        for p in plays[:15]:
-            ev_pct = p["win"] - BREAKEVEN_PP["5_flex"]
-            team = p["team"][:10]
-            det = f"[{p['stat'][:8]}] {p['player'][:14]} {p['play'][0]} {p['line']}"[:30]
-            t += f"{team:<12} {det:<32} {p['win']:>5.1f}% {ev_pct:>5.2f}%\n"
-        
-        t += "```"
         await ctx.send(t)
-        
-        # Also post to webhook
-        await send_plays_to_webhook(s, plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
+
+    # Also post to webhook
+    await send_plays_to_webhook(s, plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
 
 @bot.command(name="ud")
 async def ud(ctx, sport: str = "nba"):
@@ -387,101 +531,111 @@ async def ud(ctx, sport: str = "nba"):
         await ctx.send(f"Sports: {', '.join(UD_SPORTS.keys())}"); return
     await ctx.send(f"Fetching Underdog {sport.upper()}...")
     
-    async with aiohttp.ClientSession() as s:
-        plays, error = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
-        if error:
-            await ctx.send(error); return
-        if not plays:
-            await ctx.send("No +EV plays found"); return
+    s = await get_http_session()
+    plays, error = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
+    if error:
+        await ctx.send(error); return
+    if not plays:
+        await ctx.send("No +EV plays found"); return
         
-        # Send to channel
-        h = f"```\n{'='*72}\nUNDERDOG +EV | {sport.upper()} | {len(plays)} Plays\n{'='*72}\n```"
+    # Send to channel: header and table in one message (one Discord
+    # round-trip) unless the combined text would pass the 2000-char cap.
+    h = f"```\n{'='*72}\nUNDERDOG +EV | {sport.upper()} | {len(plays)} Plays\n{'='*72}\n```"
+
+    t = "```\n"
+    t += f"{'Team':<12} {'Bet Details':<32} {'Win%':>7} {'EV%':>7}\n"
+    t += f"{'-'*12} {'-'*32} {'-'*7} {'-'*7}\n"
+
+    for p in plays[:15]:
+        ev_pct = p["win"] - BREAKEVEN_UD["5_leg"]
+        team = p["team"][:10]
+        det = f"[{p['stat'][:8]}] {p['player'][:14]} {p['play'][0]} {p['line']}"[:30]
+        t += f"{team:<12} {det:<32} {p['win']:>5.1f}% {ev_pct:>5.2f}%\n"
+
+    t += "```"
+    msg = h + "\n" + t
+    if len(msg) <= 2000:
+        await ctx.send(msg)
+    else:
         await ctx.send(h)
-        
-        t = "```\n"
-        t += f"{'Team':<12} {'Bet Details':<32} {'Win%':>7} {'EV%':>7}\n"
-        t += f"{'-'*12} {'-'*32} {'-'*7} {'-'*7}\n"
-        
-        for p in plays[:15]:
-            ev_pct = p["win"] - BREAKEVEN_UD["5_leg"]
-            team = p["team"][:10]
-            det = f"[{p['stat'][:8]}] {p['player'][:14]} {p['play'][0]} {p['line']}"[:30]
-            t += f"{team:<12} {det:<32} {p['win']:>5.1f}% {ev_pct:>5.2f}%\n"
-        
-        t += "```"
         await ctx.send(t)
-        
-        # Also post to webhook
-        await send_plays_to_webhook(s, plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
+
+    # Also post to webhook
+    await send_plays_to_webhook(s, plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
 
 @bot.command(name="both")
 async def both(ctx, sport: str = "nba"):
     """Get +EV plays from both platforms"""
     await ctx.send(f"Fetching {sport.upper()} from PrizePicks & Underdog...")
     
-    async with aiohttp.ClientSession() as s:
-        pp_plays, pp_err = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
-        ud_plays, ud_err = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
+    s = await get_http_session()
+    pp_plays, pp_err = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
+    ud_plays, ud_err = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
         
-        if pp_plays:
-            await ctx.send(f"**PrizePicks:** {len(pp_plays)} +EV plays")
-            await send_plays_to_webhook(s, pp_plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
-        else:
-            await ctx.send(f"**PrizePicks:** {pp_err or 'No +EV plays'}")
+    if pp_plays:
+        await ctx.send(f"**PrizePicks:** {len(pp_plays)} +EV plays")
+        await send_plays_to_webhook(s, pp_plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
+    else:
+        await ctx.send(f"**PrizePicks:** {pp_err or 'No +EV plays'}")
         
-        if ud_plays:
-            await ctx.send(f"**Underdog:** {len(ud_plays)} +EV plays")
-            await send_plays_to_webhook(s, ud_plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
-        else:
-            await ctx.send(f"**Underdog:** {ud_err or 'No +EV plays'}")
+    if ud_plays:
+        await ctx.send(f"**Underdog:** {len(ud_plays)} +EV plays")
+        await send_plays_to_webhook(s, ud_plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
+    else:
+        await ctx.send(f"**Underdog:** {ud_err or 'No +EV plays'}")
 
 @bot.command(name="webhook")
 async def webhook_post(ctx, platform: str = "both", sport: str = "nba"):
     """Post +EV plays directly to webhooks"""
     await ctx.send(f"Posting {sport.upper()} to webhooks...")
     
-    async with aiohttp.ClientSession() as s:
-        if platform in ["pp", "prizepicks", "both"]:
-            plays, _ = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
-            if plays:
-                await send_plays_to_webhook(s, plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
-                await ctx.send(f"✅ Posted {len(plays)} PrizePicks plays to webhook")
-            else:
-                await ctx.send("❌ No PrizePicks +EV plays")
+    s = await get_http_session()
+    if platform in ["pp", "prizepicks", "both"]:
+        plays, _ = await analyze_platform(s, sport, "prizepicks", fetch_pp, "5_flex")
+        if plays:
+            await send_plays_to_webhook(s, plays, sport, "prizepicks", BREAKEVEN_PP["5_flex"])
+            await ctx.send(f"✅ Posted {len(plays)} PrizePicks plays to webhook")
+        else:
+            await ctx.send("❌ No PrizePicks +EV plays")
         
-        if platform in ["ud", "underdog", "both"]:
-            plays, _ = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
-            if plays:
-                await send_plays_to_webhook(s, plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
-                await ctx.send(f"✅ Posted {len(plays)} Underdog plays to webhook")
-            else:
-                await ctx.send("❌ No Underdog +EV plays")
+    if platform in ["ud", "underdog", "both"]:
+        plays, _ = await analyze_platform(s, sport, "underdog", fetch_ud, "5_leg")
+        if plays:
+            await send_plays_to_webhook(s, plays, sport, "underdog", BREAKEVEN_UD["5_leg"])
+            await ctx.send(f"✅ Posted {len(plays)} Underdog plays to webhook")
+        else:
+            await ctx.send("❌ No Underdog +EV plays")
 
 @bot.command(name="player")
 async def player(ctx, *, name: str):
     await ctx.send(f"Searching {name}...")
-    async with aiohttp.ClientSession() as s:
-        found = []
-        for sp in ["nba", "nfl", "mlb", "nhl"]:
-            try:
-                async with s.get(
-                    f"{API_BASE_URL}/api/props",
-                    params={"sport": sp, "player": name},
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    if response.status == 200:
-                        found.extend((await response.json()).get("props", []))
-            except Exception:
-                continue
-        if not found: await ctx.send("Not found"); return
-        e = discord.Embed(title=f"Props: {name}", color=discord.Color.blue())
-        for prop in found[:15]:
-            e.add_field(
-                name=f"{prop.get('stat_type', '')} ({prop.get('platform', '')})",
-                value=f"Line: {prop.get('line')}\nTeam: {prop.get('team', '')}",
-                inline=True,
-            )
-        await ctx.send(embed=e)
+    s = await get_http_session()
+
+    async def search_sport(sp):
+        async with s.get(
+            f"{API_BASE_URL}/api/props",
+            params={"sport": sp, "player": name},
+            timeout=aiohttp.ClientTimeout(total=60),
+        ) as response:
+            if response.status != 200:
+                return []
+            return orjson.loads(await response.read()).get("props", [])
+
+    # All four league searches in one wave instead of serial round-trips.
+    results = await asyncio.gather(
+        *(search_sport(sp) for sp in ["nba", "nfl", "mlb", "nhl"]),
+        return_exceptions=True,
+    )
+    found = [p for r in results if not isinstance(r, BaseException) for p in r]
+    if not found: await ctx.send("Not found"); return
+    e = discord.Embed(title=f"Props: {name}", color=discord.Color.blue())
+    for prop in found[:15]:
+        e.add_field(
+            name=f"{prop.get('stat_type', '')} ({prop.get('platform', '')})",
+            value=f"Line: {prop.get('line')}\nTeam: {prop.get('team', '')}",
+            inline=True,
+        )
+    await ctx.send(embed=e)
 
 @bot.command(name="calc")
 async def calc(ctx, over: int, under: int):
@@ -490,7 +644,7 @@ async def calc(ctx, over: int, under: int):
     e.add_field(name=f"Over ({over:+d})", value=f"{op:.2f}%", inline=True)
     e.add_field(name=f"Under ({under:+d})", value=f"{up:.2f}%", inline=True)
     b = max(op, up)
-    rec = "+EV for 2-Power+" if b >= 57.74 else "+EV for 4-Power+" if b >= 56.23 else "+EV for 5/6-Flex" if b >= 54.34 else "Not +EV"
+    rec = _CALC_RECS[bisect.bisect_right(_CALC_THRESHOLDS, b)]
     e.add_field(name="Result", value=rec, inline=False)
     await ctx.send(embed=e)
 
@@ -10,15 +10,22 @@ Usage:
     python cli.py --calc -140 +110  # Calculate no-vig odds
 """
 
+from __future__ import annotations
+
 import asyncio
-import aiohttp
 import argparse
-from dataclasses import dataclass
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 import os
 from dotenv import load_dotenv
-from fuzzywuzzy import fuzz
-import json
+
+# aiohttp, numpy, and rapidfuzz are imported inside the functions that
+# need them so `--calc` and `--help` start without paying for them.
 
 load_dotenv()
 
@@ -65,6 +72,12 @@ PROP_MAPPINGS = {
     "Shots On Goal": "player_shots_on_goal",
 }
 
+# Read-only views built once at import: interned keys make the hot-path
+# lookups pointer comparisons, and the reverse map resolves a sportsbook
+# market key back to its PrizePicks stat label.
+STAT_TO_MARKET = MappingProxyType({sys.intern(s): sys.intern(m) for s, m in PROP_MAPPINGS.items()})
+MARKET_TO_STAT = MappingProxyType({m: s for s, m in STAT_TO_MARKET.items()})
+
 BREAKEVEN_ODDS = {
     "5_flex": 54.34,
     "6_flex": 54.34,
@@ -72,6 +85,11 @@ BREAKEVEN_ODDS = {
     "2_power": 57.74,
 }
 
+# Slip tiers for the detailed view: searchsorted over the 4-Power and
+# 2-Power break-evens indexes straight into the labels.
+SLIP_TIER_CUTOFFS = [56.23, 57.74]
+SLIP_TIER_LABELS = ["5/6-Flex only", "4-Power, 5/6-Flex", "2-Power, 4-Power, 5/6-Flex"]
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -84,6 +102,11 @@ class PrizePicksProp:
     line: float
     league: str
     game_time: str
+    # Normalized once at construction so matching never re-normalizes.
+    name_norm: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.name_norm = normalize_name(self.player_name)
 
 @dataclass
 class OddsBookLine:
@@ -93,13 +116,70 @@ class OddsBookLine:
     over_odds: int
     under_odds: int
     bookmaker: str
+    name_norm: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.name_norm = normalize_name(self.player_name)
+
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Shared ClientSession so every fetch reuses one connection pool."""
+    global _http_session
+    import aiohttp
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300)
+        _http_session = aiohttp.ClientSession(connector=connector)
+    return _http_session
+
+async def close_session():
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
 
 # =============================================================================
 # API FUNCTIONS
 # =============================================================================
 
+PP_CACHE_TTL = 60  # seconds
+ODDS_CACHE_TTL = 60  # seconds
+
+_fetch_cache: dict[str, tuple[float, list]] = {}
+_fetch_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+async def _cached_fetch(key: str, ttl: float, coro_factory):
+    """TTL-memoize a fetch coroutine with single-flight semantics.
+
+    Concurrent callers for the same key share one request instead of each
+    hitting the API; empty results are never cached.
+    """
+    hit = _fetch_cache.get(key)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    async with _fetch_locks[key]:
+        hit = _fetch_cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        result = await coro_factory()
+        if result:
+            _fetch_cache[key] = (time.monotonic(), result)
+        return result
+
 async def fetch_prizepicks_props(session: aiohttp.ClientSession, league: str) -> list[PrizePicksProp]:
+    """Fetch PrizePicks props for a league, memoized for PP_CACHE_TTL seconds."""
+    return await _cached_fetch(
+        f"pp:{league.lower()}",
+        PP_CACHE_TTL,
+        lambda: _fetch_prizepicks_props(session, league),
+    )
+
+async def _fetch_prizepicks_props(session: aiohttp.ClientSession, league: str) -> list[PrizePicksProp]:
     """Fetch all props from PrizePicks for a given league."""
+    import orjson
+
     league_id = LEAGUE_IDS.get(league.lower())
     if not league_id:
         return []
@@ -117,7 +197,7 @@ async def fetch_prizepicks_props(session: aiohttp.ClientSession, league: str) ->
                 print(f"❌ PrizePicks API error: {resp.status}")
                 return []
             
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             props = []
             
             projections = data.get("data", [])
@@ -144,7 +224,17 @@ async def fetch_prizepicks_props(session: aiohttp.ClientSession, league: str) ->
         return []
 
 async def fetch_odds_api_props(session: aiohttp.ClientSession, sport: str, market: str) -> list[OddsBookLine]:
+    """Fetch Odds API props for a market, memoized for ODDS_CACHE_TTL seconds."""
+    return await _cached_fetch(
+        f"odds:{sport.lower()}:{market}",
+        ODDS_CACHE_TTL,
+        lambda: _fetch_odds_api_props(session, sport, market),
+    )
+
+async def _fetch_odds_api_props(session: aiohttp.ClientSession, sport: str, market: str) -> list[OddsBookLine]:
     """Fetch player props from The Odds API."""
+    import orjson
+
     if not ODDS_API_KEY:
         return []
     
@@ -159,7 +249,7 @@ async def fetch_odds_api_props(session: aiohttp.ClientSession, sport: str, marke
         async with session.get(events_url, params=params) as resp:
             if resp.status != 200:
                 return []
-            events = await resp.json()
+            events = orjson.loads(await resp.read())
         
         all_props = []
         
@@ -178,7 +268,7 @@ async def fetch_odds_api_props(session: aiohttp.ClientSession, sport: str, marke
                 if resp.status != 200:
                     continue
                 
-                odds_data = await resp.json()
+                odds_data = orjson.loads(await resp.read())
                 
                 for bookmaker in odds_data.get("bookmakers", []):
                     book_name = bookmaker["key"]
@@ -236,26 +326,24 @@ def calculate_no_vig(over_odds: int, under_odds: int) -> tuple[float, float]:
     total = over_implied + under_implied
     return (over_implied / total) * 100, (under_implied / total) * 100
 
+# One anchored regex pass instead of chaining five str.replace calls,
+# and it only strips suffixes at the end of the name.
+_SUFFIX_RE = re.compile(r"\s+(?:jr|sr|iii|ii|iv)\.?$", re.IGNORECASE)
+
 def normalize_name(name: str) -> str:
-    name = name.lower().strip()
-    for suffix in [" jr.", " sr.", " iii", " ii", " iv"]:
-        name = name.replace(suffix, "")
-    return name
+    return _SUFFIX_RE.sub("", name.strip()).lower()
 
 def match_players(pp_name: str, odds_names: list[str], threshold: int = 80) -> Optional[str]:
-    pp_normalized = normalize_name(pp_name)
-    best_match, best_score = None, 0
-    
-    for odds_name in odds_names:
-        score = max(
-            fuzz.ratio(pp_normalized, normalize_name(odds_name)),
-            fuzz.partial_ratio(pp_normalized, normalize_name(odds_name)),
-            fuzz.token_sort_ratio(pp_normalized, normalize_name(odds_name)),
-        )
-        if score > best_score and score >= threshold:
-            best_score, best_match = score, odds_name
-    
-    return best_match
+    """Best fuzzy match for a PrizePicks name among sportsbook names, or None."""
+    from rapidfuzz import fuzz, process
+    hit = process.extractOne(
+        pp_name,
+        odds_names,
+        scorer=fuzz.WRatio,
+        processor=normalize_name,
+        score_cutoff=threshold,
+    )
+    return hit[0] if hit else None
 
 # =============================================================================
 # MAIN ANALYSIS
@@ -263,9 +351,13 @@ def match_players(pp_name: str, odds_names: list[str], threshold: int = 80) -> O
 
 async def find_ev_props(sport: str):
     """Find all +EV props for a sport."""
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
     print(f"\n🔍 Fetching {sport.upper()} props from PrizePicks...")
-    
-    async with aiohttp.ClientSession() as session:
+
+    session = await get_session()
+    try:
         pp_props = await fetch_prizepicks_props(session, sport)
         
         if not pp_props:
@@ -292,18 +384,24 @@ async def find_ev_props(sport: str):
         
         print(f"\n📡 Fetching sportsbook odds...")
         
-        # Fetch odds for common markets
+        # Fetch odds for common markets; one .get per stat instead of an
+        # `in` check followed by a second lookup.
+        markets = {m for m in map(STAT_TO_MARKET.get, prop_by_stat) if m is not None}
+
+        # Markets fetched concurrently; the semaphore caps in-flight Odds API
+        # requests so a wide slate doesn't hammer the rate limit.
+        sem = asyncio.Semaphore(5)
+
+        async def fetch_market(market: str) -> list[OddsBookLine]:
+            async with sem:
+                print(f"   Fetching {market}...")
+                odds = await fetch_odds_api_props(session, sport, market)
+                print(f"   Found {len(odds)} {market} odds lines")
+                return odds
+
         all_odds = []
-        markets = set()
-        for stat_type in prop_by_stat.keys():
-            if stat_type in PROP_MAPPINGS:
-                markets.add(PROP_MAPPINGS[stat_type])
-        
-        for market in list(markets)[:5]:
-            print(f"   Fetching {market}...")
-            odds = await fetch_odds_api_props(session, sport, market)
+        for odds in await asyncio.gather(*(fetch_market(m) for m in list(markets)[:5])):
             all_odds.extend(odds)
-            print(f"   Found {len(odds)} odds lines")
         
         if not all_odds:
             print("❌ Could not fetch sportsbook odds")
@@ -313,48 +411,94 @@ async def find_ev_props(sport: str):
         print(f"\n🎯 Analyzing for +EV plays...")
         print("=" * 70)
         
-        ev_plays = []
-        
-        for prop in pp_props:
-            market = PROP_MAPPINGS.get(prop.stat_type)
+        matched_pairs: list[tuple[PrizePicksProp, OddsBookLine]] = []
+        # (start, end) slice of matched_pairs holding each prop's candidates.
+        group_slices: list[tuple[int, int]] = []
+
+        # Bucket odds by market once, then match each market's props against
+        # its odds names in a single cdist matrix call instead of one
+        # match_players scan per prop.
+        odds_by_market: dict[str, list[OddsBookLine]] = {}
+        for odds_line in all_odds:
+            odds_by_market.setdefault(odds_line.stat_type, []).append(odds_line)
+
+        for stat_type, stat_props in prop_by_stat.items():
+            market = STAT_TO_MARKET.get(stat_type)
             if not market:
                 continue
-            
-            relevant_odds = [o for o in all_odds if o.stat_type == market]
+            relevant_odds = odds_by_market.get(market)
             if not relevant_odds:
                 continue
-            
-            matched_name = match_players(prop.player_name, [o.player_name for o in relevant_odds])
-            if not matched_name:
-                continue
-            
+
+            # Index this market's lines by normalized player name once so the
+            # post-match lookup is a dict hit instead of a scan of all lines.
+            lines_by_name: dict[str, list[OddsBookLine]] = {}
             for odds_line in relevant_odds:
-                if odds_line.player_name != matched_name:
+                lines_by_name.setdefault(odds_line.name_norm, []).append(odds_line)
+            line_vals_by_name = {
+                name: np.fromiter((o.line for o in lines), dtype=np.float64, count=len(lines))
+                for name, lines in lines_by_name.items()
+            }
+
+            # name_norm is computed once per object in __post_init__, so the
+            # matrix call scores pre-normalized strings directly instead of
+            # re-running the processor on every comparison.
+            scores = process.cdist(
+                [p.name_norm for p in stat_props],
+                [o.name_norm for o in relevant_odds],
+                scorer=fuzz.WRatio,
+                processor=None,
+                score_cutoff=80,
+                workers=-1,
+            )
+            best_cols = scores.argmax(axis=1)
+            best_scores = scores.max(axis=1)
+
+            for prop, col, score in zip(stat_props, best_cols, best_scores):
+                if score < 80:
                     continue
-                if abs(odds_line.line - prop.line) > 0.5:
+                matched_name = relevant_odds[col].name_norm
+
+                # Vectorized ±0.5 line filter over the player's lines. Every
+                # in-range book stays a candidate; the best price is picked
+                # after the no-vig pass instead of taking the first hit.
+                near = np.flatnonzero(np.abs(line_vals_by_name[matched_name] - prop.line) <= 0.5)
+                if near.size:
+                    candidates = lines_by_name[matched_name]
+                    group_slices.append((len(matched_pairs), len(matched_pairs) + near.size))
+                    matched_pairs.extend((prop, candidates[j]) for j in near)
+
+        # One vectorized no-vig pass over every matched candidate instead of
+        # a scalar calculate_no_vig call per pair.
+        ev_plays = []
+        if matched_pairs:
+            over = np.fromiter((o.over_odds for _, o in matched_pairs), dtype=np.float64)
+            under = np.fromiter((o.under_odds for _, o in matched_pairs), dtype=np.float64)
+            over_implied = np.where(over > 0, 100.0, -over) / (np.abs(over) + 100.0)
+            under_implied = np.where(under > 0, 100.0, -under) / (np.abs(under) + 100.0)
+            total = over_implied + under_implied
+            over_probs = over_implied / total * 100.0
+            under_probs = under_implied / total * 100.0
+            best_probs = np.maximum(over_probs, under_probs)
+
+            for start, end in group_slices:
+                # Best book for this prop by no-vig win probability.
+                i = start + int(np.argmax(best_probs[start:end]))
+                if best_probs[i] < BREAKEVEN_ODDS["5_flex"]:
                     continue
-                
-                over_prob, under_prob = calculate_no_vig(odds_line.over_odds, odds_line.under_odds)
-                
-                if over_prob > under_prob:
-                    play, prob = "OVER", over_prob
-                else:
-                    play, prob = "UNDER", under_prob
-                
-                if prob >= BREAKEVEN_ODDS["5_flex"]:
-                    ev_plays.append({
-                        "player": prop.player_name,
-                        "team": prop.team,
-                        "stat": prop.stat_type,
-                        "line": prop.line,
-                        "play": play,
-                        "prob": prob,
-                        "book": odds_line.bookmaker,
-                        "over_odds": odds_line.over_odds,
-                        "under_odds": odds_line.under_odds,
-                    })
-                break
-        
+                prop, odds_line = matched_pairs[i]
+                ev_plays.append({
+                    "player": prop.player_name,
+                    "team": prop.team,
+                    "stat": prop.stat_type,
+                    "line": prop.line,
+                    "play": "OVER" if over_probs[i] > under_probs[i] else "UNDER",
+                    "prob": float(best_probs[i]),
+                    "book": odds_line.bookmaker,
+                    "over_odds": odds_line.over_odds,
+                    "under_odds": odds_line.under_odds,
+                })
+
         # Sort and display in spreadsheet format
         ev_plays.sort(key=lambda x: x["prob"], reverse=True)
         
@@ -362,15 +506,19 @@ async def find_ev_props(sport: str):
             print("😔 No +EV plays found")
             return
         
-        # Print spreadsheet header
-        print(f"\n{'='*80}")
-        print(f"🎯 PRIZEPICKS +EV FINDER | {sport.upper()} | {len(ev_plays)} Plays Found")
-        print(f"{'='*80}\n")
-        
+        # Build the whole report in memory and flush it with one write
+        # instead of a syscall per print.
+        out = []
+
+        # Spreadsheet header
+        out.append(f"\n{'='*80}")
+        out.append(f"🎯 PRIZEPICKS +EV FINDER | {sport.upper()} | {len(ev_plays)} Plays Found")
+        out.append(f"{'='*80}\n")
+
         # Column headers
-        print(f"{'Game Info':<20} {'Bet Details':<32} {'Win%':>8} {'EV%':>8}")
-        print(f"{'-'*20} {'-'*32} {'-'*8} {'-'*8}")
-        
+        out.append(f"{'Game Info':<20} {'Bet Details':<32} {'Win%':>8} {'EV%':>8}")
+        out.append(f"{'-'*20} {'-'*32} {'-'*8} {'-'*8}")
+
         for play in ev_plays:
             # Calculate EV% above break-even
             ev_above = play["prob"] - BREAKEVEN_ODDS["5_flex"]
@@ -391,47 +539,68 @@ async def find_ev_props(sport: str):
             else:
                 indicator = "🟠"
             
-            print(f"{game_info:<20} {bet_details:<32} {play['prob']:>6.1f}% {ev_above:>6.2f}%  {indicator}")
-        
+            out.append(f"{game_info:<20} {bet_details:<32} {play['prob']:>6.1f}% {ev_above:>6.2f}%  {indicator}")
+
         # Footer
-        print(f"\n{'-'*80}")
-        print("Break-Even: 5/6-Flex=54.34% | 4-Power=56.23% | 2-Power=57.74%")
-        print("EV% = Edge above 5/6-Flex break-even")
-        print(f"{'='*80}\n")
-        
+        out.append(f"\n{'-'*80}")
+        out.append("Break-Even: 5/6-Flex=54.34% | 4-Power=56.23% | 2-Power=57.74%")
+        out.append("EV% = Edge above 5/6-Flex break-even")
+        out.append(f"{'='*80}\n")
+
         # Detailed view option
-        print("\n📋 DETAILED VIEW:\n")
-        for i, play in enumerate(ev_plays[:10], 1):
+        out.append("\n📋 DETAILED VIEW:\n")
+        detailed = ev_plays[:10]
+        tiers = np.searchsorted(
+            SLIP_TIER_CUTOFFS, [play["prob"] for play in detailed], side="right"
+        )
+        for i, play in enumerate(detailed, 1):
             ev_above = play["prob"] - BREAKEVEN_ODDS["5_flex"]
-            
-            if play["prob"] >= 57.74:
-                slip = "2-Power, 4-Power, 5/6-Flex"
-            elif play["prob"] >= 56.23:
-                slip = "4-Power, 5/6-Flex"
-            else:
-                slip = "5/6-Flex only"
-            
-            print(f"{i}. {play['player']} ({play['team']})")
-            print(f"   {play['play']} {play['line']} {play['stat']}")
-            print(f"   Win%: {play['prob']:.1f}% | EV%: +{ev_above:.2f}% | Book: {play['book']}")
-            print(f"   Odds: Over {play['over_odds']:+d} / Under {play['under_odds']:+d}")
-            print(f"   ✅ Best Slip: {slip}")
-            print()
+            slip = SLIP_TIER_LABELS[tiers[i - 1]]
+
+            out.append(f"{i}. {play['player']} ({play['team']})")
+            out.append(f"   {play['play']} {play['line']} {play['stat']}")
+            out.append(f"   Win%: {play['prob']:.1f}% | EV%: +{ev_above:.2f}% | Book: {play['book']}")
+            out.append(f"   Odds: Over {play['over_odds']:+d} / Under {play['under_odds']:+d}")
+            out.append(f"   ✅ Best Slip: {slip}")
+            out.append("")
+
+        sys.stdout.write("\n".join(out) + "\n")
+    finally:
+        await close_session()
 
 async def search_player(name: str):
     """Search for a specific player's props."""
+    from rapidfuzz import fuzz, process
+
     print(f"\n🔍 Searching for '{name}'...")
-    
-    async with aiohttp.ClientSession() as session:
-        for sport in ["nba", "nfl", "mlb", "nhl"]:
-            props = await fetch_prizepicks_props(session, sport)
-            
-            matches = [p for p in props if fuzz.partial_ratio(name.lower(), p.player_name.lower()) >= 75]
-            
-            if matches:
-                print(f"\n✅ Found in {sport.upper()}:")
-                for prop in matches:
-                    print(f"   {prop.player_name} ({prop.team}) - {prop.stat_type}: {prop.line}")
+
+    sports = ["nba", "nfl", "mlb", "nhl"]
+    session = await get_session()
+    try:
+        # All four leagues fetched concurrently over the shared session.
+        results = await asyncio.gather(
+            *(fetch_prizepicks_props(session, sport) for sport in sports)
+        )
+    finally:
+        await close_session()
+
+    for sport, props in zip(sports, results):
+        # One C-level extract call over all names instead of a
+        # per-player partial_ratio loop.
+        hits = process.extract(
+            name,
+            [p.player_name for p in props],
+            scorer=fuzz.partial_ratio,
+            processor=str.lower,
+            score_cutoff=75,
+            limit=None,
+        )
+        matches = [props[idx] for _, _, idx in hits]
+
+        if matches:
+            print(f"\n✅ Found in {sport.upper()}:")
+            for prop in matches:
+                print(f"   {prop.player_name} ({prop.team}) - {prop.stat_type}: {prop.line}")
 
 def calc_no_vig(over: int, under: int):
     """Calculate and display no-vig odds."""
@@ -455,6 +624,14 @@ def calc_no_vig(over: int, under: int):
 # CLI
 # =============================================================================
 
+def _install_uvloop():
+    """Switch asyncio to uvloop's faster event loop when it's available."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
 def main():
     parser = argparse.ArgumentParser(description="PrizePicks +EV Finder")
     parser.add_argument("sport", nargs="?", help="Sport to analyze (nba, nfl, mlb, nhl)")
@@ -467,8 +644,10 @@ def main():
     if args.calc:
         calc_no_vig(args.calc[0], args.calc[1])
     elif args.player:
+        _install_uvloop()
         asyncio.run(search_player(args.player))
     elif args.sport:
+        _install_uvloop()
         asyncio.run(find_ev_props(args.sport))
     else:
         print("PrizePicks +EV Finder")
@@ -5,12 +5,19 @@ Runs both the Discord bot and FastAPI server concurrently.
 
 import asyncio
 import os
-import threading
 import uvicorn
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    # uvloop ships with uvicorn[standard] on Linux; use it for the bot's
+    # loop too when it's importable.
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 def run_api():
     """Run the FastAPI server."""
     port = int(os.getenv("PORT", 8000))
@@ -30,11 +37,36 @@ def run_bot():
     else:
         print("Warning: DISCORD_TOKEN not set, bot not started")
 
+async def run_both():
+    """Run the API server and Discord bot on one event loop.
+
+    A single loop lets the bot and API share async resources and avoids
+    the thread-per-service overhead; uvicorn's Server.serve() plays the
+    role uvicorn.run() does in the API-only path.
+    """
+    from bot import bot, DISCORD_TOKEN
+
+    port = int(os.getenv("PORT", 8000))
+    config = uvicorn.Config("api:app", host="0.0.0.0", port=port, log_level="info")
+    server = uvicorn.Server(config)
+
+    tasks = [server.serve()]
+    if DISCORD_TOKEN:
+        tasks.append(bot.start(DISCORD_TOKEN))
+    else:
+        print("Warning: DISCORD_TOKEN not set, bot not started")
+
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        if not bot.is_closed():
+            await bot.close()
+
 def main():
     """Run both services."""
     # Check what to run based on environment
     run_mode = os.getenv("RUN_MODE", "both").lower()
-    
+
     if run_mode == "api":
         # Run only API (useful for testing)
         print("Starting API server only...")
@@ -46,13 +78,7 @@ def main():
     else:
         # Run both (default for production)
         print("Starting both API server and Discord bot...")
-        
-        # Keep the web process in the main thread so Railway health and
-        # lifecycle management follow the API rather than the Discord client.
-        bot_thread = threading.Thread(target=run_bot, daemon=True)
-        bot_thread.start()
-        run_api()
+        asyncio.run(run_both())
 
 if __name__ == "__main__":
     main()
-
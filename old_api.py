@@ -9,18 +9,29 @@ Supported Platforms:
 - Betr Picks (needs research)
 - ParlayPlay (needs research)
 
-Run with: uvicorn api:app --reload
+Run with: uvicorn old_api:app --loop uvloop --http httptools
+(uvicorn[standard] ships uvloop + httptools; --reload for development)
 """
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 import aiohttp
 import asyncio
+import bisect
+import numpy as np
 from datetime import datetime, timedelta
-from fuzzywuzzy import fuzz
+from functools import lru_cache
+from operator import itemgetter
+from cachetools import TTLCache
+from rapidfuzz import fuzz, process
+import msgspec
+import orjson
 import os
+import re
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -35,7 +46,8 @@ FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 app = FastAPI(
     title="EV Dashboard API",
     description="Find +EV plays across DFS pick'em platforms",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Allow frontend to access API
@@ -54,34 +66,58 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("startup")
+async def init_http_session() -> None:
+    """Create one pooled ClientSession for the app's lifetime.
+
+    A per-request session pays TLS handshakes and DNS resolution on every
+    upstream call; a shared connector keeps connections warm across requests.
+    """
+    app.state.session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        ),
+        timeout=aiohttp.ClientTimeout(total=15),
+    )
+
+
+@app.on_event("shutdown")
+async def close_http_session() -> None:
+    await app.state.session.close()
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
 # PrizePicks League IDs
-PP_LEAGUE_IDS = {
-    "nba": 7, "nfl": 2, "mlb": 3, "nhl": 8, 
+PP_LEAGUE_IDS = MappingProxyType({
+    "nba": 7, "nfl": 2, "mlb": 3, "nhl": 8,
     "ncaab": 10, "ncaaf": 4, "soccer": 17
-}
+})
 
 # Underdog Sport mappings
-UD_SPORTS = {"nba": "NBA", "nfl": "NFL", "mlb": "MLB", "nhl": "NHL"}
+UD_SPORTS = MappingProxyType({"nba": "NBA", "nfl": "NFL", "mlb": "MLB", "nhl": "NHL"})
 
 # Main sports for "all" queries
 MAIN_SPORTS = ["nba", "nfl", "mlb", "nhl"]
 
 # The Odds API sport keys
-ODDS_API_SPORTS = {
+ODDS_API_SPORTS = MappingProxyType({
     "nba": "basketball_nba",
     "nfl": "americanfootball_nfl",
     "mlb": "baseball_mlb",
     "nhl": "icehockey_nhl",
     "ncaab": "basketball_ncaab",
     "ncaaf": "americanfootball_ncaaf",
-}
+})
 
 # Prop type mappings (platform stat -> Odds API market)
-PROP_MAPPINGS = {
+PROP_MAPPINGS = MappingProxyType({
     # NBA
     "Points": "player_points",
     "Rebounds": "player_rebounds",
@@ -112,7 +148,11 @@ PROP_MAPPINGS = {
     "passing_yards": "player_pass_yds",
     "rushing_yards": "player_rush_yds",
     "receiving_yards": "player_reception_yds",
-}
+})
+
+# Case-insensitive stat_type -> market index: one lowercase dict probe per prop
+# instead of mixed-case misses against the platform-cased keys above.
+_PROP_MAP_CI = MappingProxyType({k.lower(): v for k, v in PROP_MAPPINGS.items()})
 
 # Break-even percentages by platform and slip type
 BREAKEVEN = {
@@ -138,11 +178,25 @@ BREAKEVEN = {
     },
 }
 
+# Slip types per platform sorted by break-even ascending, so finding every
+# +EV slip type for a win probability is a single bisect instead of a dict scan.
+_BE_SORTED = {
+    plat: sorted(
+        ((slip, be) for slip, be in breakevens.items() if slip != "default"),
+        key=lambda item: item[1],
+    )
+    for plat, breakevens in BREAKEVEN.items()
+}
+_BE_KEYS = {plat: [slip for slip, _ in items] for plat, items in _BE_SORTED.items()}
+_BE_VALS = {plat: [be for _, be in items] for plat, items in _BE_SORTED.items()}
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
 class Prop(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     player_name: str
     team: str
@@ -154,6 +208,8 @@ class Prop(BaseModel):
     game_time: Optional[str] = None
 
 class SharpOdds(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     bookmaker: str
     line: float
     over_odds: int
@@ -162,6 +218,8 @@ class SharpOdds(BaseModel):
     under_probability: float
 
 class EVPlay(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     prop: Prop
     sharp_odds: Optional[SharpOdds] = None
     recommended_play: str  # "OVER" or "UNDER"
@@ -170,6 +228,8 @@ class EVPlay(BaseModel):
     best_for: list[str]  # ["5_flex", "4_power", etc.]
 
 class MiddleOpportunity(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     player_name: str
     stat_type: str
     sport: str
@@ -179,6 +239,8 @@ class MiddleOpportunity(BaseModel):
     middle_zone: list[float]
 
 class GameSummary(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     sport: str
     home_team: str
@@ -192,12 +254,79 @@ class GameSummary(BaseModel):
 # PLATFORM FETCHERS
 # =============================================================================
 
+# Upstream data changes on the order of seconds to minutes, not per-request.
+# Short TTL caches collapse burst refreshes (and concurrent dashboard users)
+# into a single upstream call per (platform, sport, market) window.
+_PLATFORM_CACHE = TTLCache(maxsize=64, ttl=30)
+_ODDS_CACHE = TTLCache(maxsize=64, ttl=60)  # Odds API calls count against quota
+
+# Single-flight: concurrent callers missing the cache for the same key await
+# one shared task instead of each issuing a duplicate upstream call.
+_INFLIGHT: dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, coro_factory):
+    """Run coro_factory once per key at a time; concurrent callers share the result."""
+    fut = _INFLIGHT.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.ensure_future(coro_factory())
+    _INFLIGHT[key] = fut
+    try:
+        return await fut
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+# msgspec structs mirroring the PrizePicks JSON:API envelope. Decoding straight
+# into typed structs skips the dict intermediary (and its per-projection chained
+# .get() lookups) when parsing 250+ projections per refresh.
+class PPAttributes(msgspec.Struct):
+    stat_type: str = ""
+    line_score: float | str = 0.0
+    start_time: str = ""
+
+
+class PPProjection(msgspec.Struct):
+    id: str = ""
+    attributes: PPAttributes = msgspec.field(default_factory=PPAttributes)
+    relationships: dict = msgspec.field(default_factory=dict)
+
+
+class PPIncluded(msgspec.Struct):
+    id: str = ""
+    attributes: dict = msgspec.field(default_factory=dict)
+
+
+class PPEnvelope(msgspec.Struct):
+    data: list[PPProjection] = msgspec.field(default_factory=list)
+    included: list[PPIncluded] = msgspec.field(default_factory=list)
+
+
+_PP_DECODER = msgspec.json.Decoder(PPEnvelope)
+
+
 async def fetch_prizepicks(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """Fetch props from PrizePicks API."""
-    league_id = PP_LEAGUE_IDS.get(sport.lower())
+    sport_lower = sport.lower()
+    league_id = PP_LEAGUE_IDS.get(sport_lower)
     if not league_id:
         return []
-    
+
+    cache_key = ("prizepicks", sport_lower)
+    cached = _PLATFORM_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    return await _single_flight(
+        cache_key, lambda: _fetch_prizepicks(session, league_id, sport, cache_key)
+    )
+
+
+async def _fetch_prizepicks(
+    session: aiohttp.ClientSession, league_id: int, sport: str, cache_key: tuple
+) -> list[Prop]:
     url = f"https://api.prizepicks.com/projections?league_id={league_id}&per_page=250&single_stat=true"
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -210,35 +339,37 @@ async def fetch_prizepicks(session: aiohttp.ClientSession, sport: str) -> list[P
         "sec-ch-ua-mobile": "?0",
         "sec-ch-ua-platform": '"macOS"',
         "sec-fetch-dest": "empty",
-        "sec-fetch-mode": "cors", 
+        "sec-fetch-mode": "cors",
         "sec-fetch-site": "same-site",
     }
-    
+
     try:
         async with session.get(url, headers=headers, timeout=10) as resp:
             if resp.status != 200:
                 return []
-            
-            data = await resp.json()
-            included = {i["id"]: i for i in data.get("included", [])}
+
+            env = _PP_DECODER.decode(await resp.read())
+            included = {i.id: i.attributes for i in env.included}
+            sport_upper = sport.upper()
             props = []
-            
-            for proj in data.get("data", []):
-                attrs = proj.get("attributes", {})
-                player_id = proj.get("relationships", {}).get("new_player", {}).get("data", {}).get("id")
-                player_data = included.get(player_id, {}).get("attributes", {})
-                
-                props.append(Prop(
-                    id=f"pp_{proj.get('id', '')}",
+
+            for proj in env.data:
+                attrs = proj.attributes
+                player_id = proj.relationships.get("new_player", {}).get("data", {}).get("id")
+                player_data = included.get(player_id, {})
+
+                props.append(Prop.model_construct(
+                    id=f"pp_{proj.id}",
                     player_name=player_data.get("name", "Unknown"),
                     team=player_data.get("team", ""),
-                    sport=sport.upper(),
-                    stat_type=attrs.get("stat_type", ""),
+                    sport=sport_upper,
+                    stat_type=attrs.stat_type,
                     platform="prizepicks",
-                    line=float(attrs.get("line_score", 0)),
-                    game_time=attrs.get("start_time", ""),
+                    line=float(attrs.line_score),
+                    game_time=attrs.start_time,
                 ))
-            
+
+            _PLATFORM_CACHE[cache_key] = props
             return props
     except Exception as e:
         print(f"PrizePicks error: {e}")
@@ -247,62 +378,83 @@ async def fetch_prizepicks(session: aiohttp.ClientSession, sport: str) -> list[P
 
 async def fetch_underdog(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """Fetch props from Underdog Fantasy API."""
-    ud_sport = UD_SPORTS.get(sport.lower())
+    sport_lower = sport.lower()
+    ud_sport = UD_SPORTS.get(sport_lower)
     if not ud_sport:
         return []
-    
+
+    cache_key = ("underdog", sport_lower)
+    cached = _PLATFORM_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    return await _single_flight(
+        cache_key, lambda: _fetch_underdog(session, ud_sport, sport, cache_key)
+    )
+
+
+async def _fetch_underdog(
+    session: aiohttp.ClientSession, ud_sport: str, sport: str, cache_key: tuple
+) -> list[Prop]:
     url = "https://api.underdogfantasy.com/beta/v6/over_under_lines"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "application/json",
     }
-    
+
     try:
         async with session.get(url, headers=headers, timeout=15) as resp:
             if resp.status != 200:
                 return []
-            
-            data = await resp.json()
-            
-            # Build lookup dictionaries
-            games = {g["id"]: g for g in data.get("games", [])}
-            appearances = {a["id"]: a for a in data.get("appearances", [])}
-            players = {p["id"]: p for p in data.get("players", [])}
-            
+
+            data = orjson.loads(await resp.read())
+
+            # Build lookup dictionaries in one pass per collection
+            get_id = itemgetter("id")
+            game_rows = data.get("games", [])
+            appearance_rows = data.get("appearances", [])
+            player_rows = data.get("players", [])
+            games = dict(zip(map(get_id, game_rows), game_rows))
+            appearances = dict(zip(map(get_id, appearance_rows), appearance_rows))
+            players = dict(zip(map(get_id, player_rows), player_rows))
+
+            # Hoist bound methods out of the hot loop (LOAD_FAST vs LOAD_ATTR)
+            sport_upper = sport.upper()
+            games_get = games.get
+            appearances_get = appearances.get
+            players_get = players.get
+            empty: dict = {}
+
             props = []
             for line in data.get("over_under_lines", []):
-                ou = line.get("over_under", {})
-                app_stat = ou.get("appearance_stat", {})
-                app_id = app_stat.get("appearance_id")
-                app = appearances.get(app_id, {})
-                
-                # Get game info via match_id
-                match_id = app.get("match_id")
-                game = games.get(match_id, {})
-                
-                # Filter by sport
+                app_stat = line.get("over_under", empty).get("appearance_stat", empty)
+                app = appearances_get(app_stat.get("appearance_id"), empty)
+
+                # Get game info via match_id, then filter by sport
+                game = games_get(app.get("match_id"), empty)
                 if game.get("sport_id", "").upper() != ud_sport:
                     continue
-                
-                player_id = app.get("player_id")
-                player = players.get(player_id, {})
-                
+
+                player = players_get(app.get("player_id"), empty)
+
                 stat_type = app_stat.get("display_stat") or app_stat.get("stat", "")
                 stat_value = line.get("stat_value")
-                
+
                 if player and stat_value:
                     name = f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
-                    props.append(Prop(
+                    title = game.get("title", "")
+                    props.append(Prop.model_construct(
                         id=f"ud_{line.get('id', '')}",
                         player_name=name,
-                        team=game.get("title", "").split(" @ ")[0] if " @ " in game.get("title", "") else "",
-                        sport=sport.upper(),
+                        team=title.partition(" @ ")[0] if " @ " in title else "",
+                        sport=sport_upper,
                         stat_type=stat_type,
                         platform="underdog",
                         line=float(stat_value),
                         game_time=game.get("scheduled_at", ""),
                     ))
-            
+
+            _PLATFORM_CACHE[cache_key] = props
             return props
     except Exception as e:
         print(f"Underdog error: {e}")
@@ -312,11 +464,11 @@ async def fetch_underdog(session: aiohttp.ClientSession, sport: str) -> list[Pro
 async def fetch_sleeper_picks(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """
     Fetch props from Sleeper Picks.
-    
-    NOTE: Sleeper Picks (the pick'em product) uses a DIFFERENT API than the 
-    fantasy football API documented at docs.sleeper.com. The pick'em API 
+
+    NOTE: Sleeper Picks (the pick'em product) uses a DIFFERENT API than the
+    fantasy football API documented at docs.sleeper.com. The pick'em API
     endpoints need to be discovered through browser network inspection.
-    
+
     Known info:
     - Sleeper Picks is at sleeper.com/picks
     - May use api.sleeper.com or a different subdomain
@@ -331,18 +483,18 @@ async def fetch_sleeper_picks(session: aiohttp.ClientSession, sport: str) -> lis
 async def fetch_betr_picks(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """
     Fetch props from Betr Picks.
-    
+
     RESEARCH NOTES:
     - Betr Picks URL: picks.betr.app/picks/fantasy-pick-slip
     - API endpoint likely at: api.betr.app or similar
-    
+
     TO FIND THE API:
     1. Open picks.betr.app in Chrome
     2. Open DevTools (F12) → Network tab
     3. Filter by "XHR" or "Fetch"
     4. Browse the props and watch for API calls
     5. Look for endpoints returning JSON with player props
-    
+
     Expected endpoints might be:
     - https://api.betr.app/v1/picks
     - https://api.betr.app/v1/props
@@ -354,19 +506,19 @@ async def fetch_betr_picks(session: aiohttp.ClientSession, sport: str) -> list[P
         "https://api.betr.app/v1/picks/lines",
         "https://picks.betr.app/api/v1/lines",
     ]
-    
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "application/json",
         "Origin": "https://picks.betr.app",
         "Referer": "https://picks.betr.app/",
     }
-    
+
     for url in possible_urls:
         try:
             async with session.get(url, headers=headers, timeout=5) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     # If we get data, parse it
                     # Structure will need to be discovered
                     print(f"Betr API found at: {url}")
@@ -375,7 +527,7 @@ async def fetch_betr_picks(session: aiohttp.ClientSession, sport: str) -> list[P
                     return []
         except Exception as e:
             continue
-    
+
     # API not found yet - needs manual research
     return []
 
@@ -383,7 +535,7 @@ async def fetch_betr_picks(session: aiohttp.ClientSession, sport: str) -> list[P
 async def fetch_chalkboard(session: aiohttp.ClientSession, sport: str) -> list[Prop]:
     """
     Fetch props from Chalkboard.
-    
+
     Since you mentioned you already have Chalkboard working, you can add
     your implementation here. The structure should be similar to PrizePicks/Underdog.
     """
@@ -399,27 +551,65 @@ async def fetch_chalkboard(session: aiohttp.ClientSession, sport: str) -> list[P
 # Preferred sharp books in order of priority
 SHARP_BOOKS = ["draftkings", "fanduel", "betmgm", "caesars", "pointsbet"]
 
+# O(1) rank lookup for sorting bookmakers by preference
+SHARP_BOOK_RANK = {name: i for i, name in enumerate(SHARP_BOOKS)}
+_SHARPEST = frozenset(SHARP_BOOKS[:2])  # DK/FD are sharpest
+
 async def fetch_sharp_odds(session: aiohttp.ClientSession, sport: str, market: str) -> list[dict]:
     """Fetch odds from The Odds API for a specific market, prioritizing sharp books."""
     if not ODDS_API_KEY:
         return []
-    
+
     sport_key = ODDS_API_SPORTS.get(sport.lower())
     if not sport_key:
         return []
-    
-    try:
-        # Get events
+
+    cache_key = ("odds", sport_key, market)
+    cached = _ODDS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    return await _single_flight(
+        cache_key, lambda: _fetch_sharp_odds(session, sport_key, market, cache_key)
+    )
+
+
+async def _fetch_odds_events(session: aiohttp.ClientSession, sport_key: str) -> list[dict]:
+    """Fetch the event list for a sport, shared across all market fetches.
+
+    Cached and single-flighted separately from the per-market odds so that
+    concurrent markets for the same sport pay for one events request total.
+    """
+    cache_key = ("events", sport_key)
+    cached = _ODDS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async def _fetch() -> list[dict]:
         events_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events"
         async with session.get(events_url, params={"apiKey": ODDS_API_KEY}) as resp:
             if resp.status != 200:
                 return []
-            events = await resp.json()
-        
-        all_odds = []
-        
-        # Get odds for each event (limit to conserve API calls)
-        for event in events[:8]:
+            events = orjson.loads(await resp.read())
+        _ODDS_CACHE[cache_key] = events
+        return events
+
+    return await _single_flight(cache_key, _fetch)
+
+
+async def _fetch_sharp_odds(
+    session: aiohttp.ClientSession, sport_key: str, market: str, cache_key: tuple
+) -> list[dict]:
+    try:
+        events = await _fetch_odds_events(session, sport_key)
+        if not events:
+            return []
+
+        # Fetch odds for each event concurrently; the semaphore bounds how many
+        # requests hit The Odds API at once (no blanket sleep needed).
+        sem = asyncio.Semaphore(4)
+
+        async def _fetch_event_odds(event: dict) -> list[dict]:
             odds_url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/events/{event['id']}/odds"
             params = {
                 "apiKey": ODDS_API_KEY,
@@ -429,49 +619,62 @@ async def fetch_sharp_odds(session: aiohttp.ClientSession, sport: str, market: s
                 # Request specific bookmakers - prioritize sharp books
                 "bookmakers": ",".join(SHARP_BOOKS),
             }
-            
-            async with session.get(odds_url, params=params) as resp:
-                if resp.status != 200:
-                    continue
-                
-                data = await resp.json()
-                
-                # Sort bookmakers by our preference order
-                bookmakers = data.get("bookmakers", [])
-                bookmakers.sort(key=lambda b: SHARP_BOOKS.index(b["key"]) if b["key"] in SHARP_BOOKS else 999)
-                
-                for bookmaker in bookmakers:
-                    for mkt in bookmaker.get("markets", []):
-                        if mkt["key"] != market:
-                            continue
-                        
-                        # Group outcomes by player
-                        player_outcomes = {}
-                        for outcome in mkt.get("outcomes", []):
-                            player = outcome.get("description", "")
-                            if player not in player_outcomes:
-                                player_outcomes[player] = {}
-                            
-                            name = outcome.get("name", "").lower()
-                            if "over" in name:
-                                player_outcomes[player]["over"] = outcome
-                            elif "under" in name:
-                                player_outcomes[player]["under"] = outcome
-                        
-                        for player, outcomes in player_outcomes.items():
-                            if "over" in outcomes and "under" in outcomes:
-                                all_odds.append({
-                                    "player": player,
-                                    "line": outcomes["over"].get("point", 0),
-                                    "over_odds": outcomes["over"].get("price", -110),
-                                    "under_odds": outcomes["under"].get("price", -110),
-                                    "bookmaker": bookmaker["key"],
-                                    "market": market,
-                                    "is_sharp": bookmaker["key"] in SHARP_BOOKS[:2],  # DK/FD are sharpest
-                                })
-            
-            await asyncio.sleep(0.3)  # Rate limiting
-        
+
+            async with sem:
+                async with session.get(odds_url, params=params) as resp:
+                    if resp.status != 200:
+                        return []
+                    data = orjson.loads(await resp.read())
+
+            # Sort bookmakers by our preference order
+            bookmakers = data.get("bookmakers", [])
+            bookmakers.sort(key=lambda b: SHARP_BOOK_RANK.get(b["key"], 999))
+
+            event_odds = []
+            for bookmaker in bookmakers:
+                for mkt in bookmaker.get("markets", []):
+                    if mkt["key"] != market:
+                        continue
+
+                    # Group outcomes by player
+                    player_outcomes = {}
+                    for outcome in mkt.get("outcomes", []):
+                        player = outcome.get("description", "")
+                        if player not in player_outcomes:
+                            player_outcomes[player] = {}
+
+                        name = outcome.get("name", "").lower()
+                        if "over" in name:
+                            player_outcomes[player]["over"] = outcome
+                        elif "under" in name:
+                            player_outcomes[player]["under"] = outcome
+
+                    for player, outcomes in player_outcomes.items():
+                        if "over" in outcomes and "under" in outcomes:
+                            event_odds.append({
+                                "player": player,
+                                "line": outcomes["over"].get("point", 0),
+                                "over_odds": outcomes["over"].get("price", -110),
+                                "under_odds": outcomes["under"].get("price", -110),
+                                "bookmaker": bookmaker["key"],
+                                "market": market,
+                                "is_sharp": bookmaker["key"] in _SHARPEST,
+                            })
+            return event_odds
+
+        # Limit event count to conserve API calls
+        results = await asyncio.gather(
+            *[_fetch_event_odds(event) for event in events[:8]],
+            return_exceptions=True,
+        )
+
+        all_odds = []
+        for event_odds in results:
+            if isinstance(event_odds, Exception):
+                continue
+            all_odds.extend(event_odds)
+
+        _ODDS_CACHE[cache_key] = all_odds
         return all_odds
     except Exception as e:
         print(f"Odds API error: {e}")
@@ -481,60 +684,85 @@ async def fetch_sharp_odds(session: aiohttp.ClientSession, sport: str, market: s
 # CALCULATIONS
 # =============================================================================
 
+def _implied_prob(odds: int) -> float:
+    """Implied win probability (0-1) of American odds."""
+    if odds > 0:
+        return 100.0 / (odds + 100)
+    return -odds / (-odds + 100.0)
+
+
 def calculate_no_vig(over_odds: int, under_odds: int) -> tuple[float, float]:
     """Calculate true probabilities by removing the vig."""
-    def implied_prob(odds: int) -> float:
-        if odds > 0:
-            return 100 / (odds + 100)
-        else:
-            return abs(odds) / (abs(odds) + 100)
-    
-    over_implied = implied_prob(over_odds)
-    under_implied = implied_prob(under_odds)
+    over_implied = _implied_prob(over_odds)
+    under_implied = _implied_prob(under_odds)
     total = over_implied + under_implied
-    
+
     over_true = (over_implied / total) * 100
     under_true = (under_implied / total) * 100
-    
+
     return over_true, under_true
 
 
+def calculate_no_vig_vec(over_odds, under_odds) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized calculate_no_vig over parallel arrays of American odds."""
+    over = np.asarray(over_odds, dtype=np.float64)
+    under = np.asarray(under_odds, dtype=np.float64)
+
+    over_implied = np.where(over > 0, 100.0 / (over + 100.0), -over / (-over + 100.0))
+    under_implied = np.where(under > 0, 100.0 / (under + 100.0), -under / (-under + 100.0))
+    total = over_implied + under_implied
+
+    return (over_implied / total) * 100.0, (under_implied / total) * 100.0
+
+
+# One compiled pass over the name instead of five str.replace scans
+_SUFFIX_RE = re.compile(r"\s+(?:jr\.|sr\.|iii|ii|iv)$")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(n: str) -> str:
+    """Lowercase a player name and strip generational suffixes."""
+    return _SUFFIX_RE.sub("", n.lower().strip())
+
+
+@lru_cache(maxsize=8192)
+def _best_candidate_index(
+    name_norm: str, cand_norm: tuple[str, ...], threshold: int
+) -> int:
+    """Return the index of the best fuzzy match, or -1 if none clears the cutoff."""
+    # Cheap first pass: QRatio at a loose cutoff discards candidates that share
+    # almost no characters with the query, so the heavier WRatio (which combines
+    # ratio/partial/token_sort) only re-ranks the handful of plausible survivors.
+    survivors = process.extract(
+        name_norm, cand_norm, scorer=fuzz.QRatio, score_cutoff=60, limit=10
+    )
+    if not survivors:
+        return -1
+
+    match = process.extractOne(
+        name_norm,
+        [cand for cand, _, _ in survivors],
+        scorer=fuzz.WRatio,
+        score_cutoff=threshold,
+    )
+    return -1 if match is None else survivors[match[2]][2]
+
+
 def match_player(name: str, candidates: list[str], threshold: int = 80) -> Optional[str]:
     """Fuzzy match a player name to a list of candidates."""
-    def normalize(n: str) -> str:
-        n = n.lower().strip()
-        for suffix in [" jr.", " sr.", " iii", " ii", " iv"]:
-            n = n.replace(suffix, "")
-        return n
-    
-    name_norm = normalize(name)
-    best_match = None
-    best_score = 0
-    
-    for candidate in candidates:
-        cand_norm = normalize(candidate)
-        score = max(
-            fuzz.ratio(name_norm, cand_norm),
-            fuzz.partial_ratio(name_norm, cand_norm),
-            fuzz.token_sort_ratio(name_norm, cand_norm),
-        )
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = candidate
-    
-    return best_match
+    cand_norm = tuple(_normalize_name(c) for c in candidates)
+    idx = _best_candidate_index(_normalize_name(name), cand_norm, threshold)
+    return None if idx < 0 else candidates[idx]
 
 
 def get_best_slip_types(win_prob: float, platform: str) -> list[str]:
     """Get which slip types are +EV for a given win probability."""
-    breakevens = BREAKEVEN.get(platform, BREAKEVEN["prizepicks"])
-    result = []
-    
-    for slip_type, be in breakevens.items():
-        if slip_type != "default" and win_prob >= be:
-            result.append(slip_type)
-    
-    return result
+    if platform not in _BE_VALS:
+        platform = "prizepicks"
+
+    # Every slip type whose break-even is <= win_prob, found with one bisect.
+    idx = bisect.bisect_right(_BE_VALS[platform], win_prob)
+    return _BE_KEYS[platform][:idx]
 
 # =============================================================================
 # API ENDPOINTS
@@ -566,27 +794,27 @@ async def get_odds_api_usage():
     """Check The Odds API usage/remaining requests."""
     if not ODDS_API_KEY:
         return {"error": "ODDS_API_KEY not configured", "configured": False}
-    
+
     # Make a lightweight request to check usage (sports list is free and returns headers)
-    async with aiohttp.ClientSession() as session:
-        try:
-            url = "https://api.the-odds-api.com/v4/sports"
-            async with session.get(url, params={"apiKey": ODDS_API_KEY}) as resp:
-                if resp.status == 401:
-                    return {"error": "Invalid API key", "configured": True}
-                
-                # Extract usage from headers
-                requests_remaining = resp.headers.get("x-requests-remaining", "unknown")
-                requests_used = resp.headers.get("x-requests-used", "unknown")
-                
-                return {
-                    "configured": True,
-                    "requests_used": int(requests_used) if requests_used.isdigit() else requests_used,
-                    "requests_remaining": int(requests_remaining) if requests_remaining.isdigit() else requests_remaining,
-                    "requests_total": 500,  # Free tier limit
-                }
-        except Exception as e:
-            return {"error": str(e), "configured": True}
+    session = app.state.session
+    try:
+        url = "https://api.the-odds-api.com/v4/sports"
+        async with session.get(url, params={"apiKey": ODDS_API_KEY}) as resp:
+            if resp.status == 401:
+                return {"error": "Invalid API key", "configured": True}
+
+            # Extract usage from headers
+            requests_remaining = resp.headers.get("x-requests-remaining", "unknown")
+            requests_used = resp.headers.get("x-requests-used", "unknown")
+
+            return {
+                "configured": True,
+                "requests_used": int(requests_used) if requests_used.isdigit() else requests_used,
+                "requests_remaining": int(requests_remaining) if requests_remaining.isdigit() else requests_remaining,
+                "requests_total": 500,  # Free tier limit
+            }
+    except Exception as e:
+        return {"error": str(e), "configured": True}
 
 
 @app.get("/api/props")
@@ -598,41 +826,41 @@ async def get_props(
     player: Optional[str] = Query(None, description="Search by player name"),
 ):
     """Get all props across platforms with optional filters."""
-    async with aiohttp.ClientSession() as session:
-        # Determine which sports to fetch
-        sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
-        
-        # Fetch from all platforms concurrently for all sports
-        tasks = []
-        for s in sports_to_fetch:
-            tasks.extend([
-                fetch_prizepicks(session, s),
-                fetch_underdog(session, s),
-                fetch_betr_picks(session, s),
-                fetch_chalkboard(session, s),
-            ])
-        results = await asyncio.gather(*tasks)
-        
-        # Combine all props
-        all_props = []
-        for props in results:
-            all_props.extend(props)
-        
-        # Apply filters
-        if platform:
-            all_props = [p for p in all_props if p.platform == platform.lower()]
-        
-        if stat:
-            all_props = [p for p in all_props if stat.lower() in p.stat_type.lower()]
-        
-        if player:
-            all_props = [p for p in all_props if fuzz.partial_ratio(player.lower(), p.player_name.lower()) >= 70]
-        
-        return {
-            "count": len(all_props),
-            "sport": sport.upper(),
-            "props": [p.dict() for p in all_props]
-        }
+    session = app.state.session
+    # Determine which sports to fetch
+    sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
+
+    # Fetch from all platforms concurrently for all sports
+    tasks = []
+    for s in sports_to_fetch:
+        tasks.extend([
+            fetch_prizepicks(session, s),
+            fetch_underdog(session, s),
+            fetch_betr_picks(session, s),
+            fetch_chalkboard(session, s),
+        ])
+    results = await asyncio.gather(*tasks)
+
+    # Combine all props
+    all_props = []
+    for props in results:
+        all_props.extend(props)
+
+    # Apply filters
+    if platform:
+        all_props = [p for p in all_props if p.platform == platform.lower()]
+
+    if stat:
+        all_props = [p for p in all_props if stat.lower() in p.stat_type.lower()]
+
+    if player:
+        all_props = [p for p in all_props if fuzz.partial_ratio(player.lower(), p.player_name.lower()) >= 70]
+
+    return {
+        "count": len(all_props),
+        "sport": sport.upper(),
+        "props": [p.model_dump() for p in all_props]
+    }
 
 
 @app.get("/api/ev")
@@ -643,109 +871,130 @@ async def get_ev_plays(
     min_win: float = Query(54, description="Minimum win probability"),
 ):
     """Get +EV plays with sharp odds analysis. Prioritizes DraftKings/FanDuel lines."""
-    async with aiohttp.ClientSession() as session:
-        # Determine which sports to fetch
-        sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
-        
-        # Fetch props from all platforms for all sports
-        all_props = []
-        for s in sports_to_fetch:
-            pp_props = await fetch_prizepicks(session, s)
-            ud_props = await fetch_underdog(session, s)
-            betr_props = await fetch_betr_picks(session, s)
-            chalk_props = await fetch_chalkboard(session, s)
-            all_props.extend(pp_props + ud_props + betr_props + chalk_props)
-        
-        if platform:
-            all_props = [p for p in all_props if p.platform == platform.lower()]
-        
-        if not all_props:
-            return {"count": 0, "plays": [], "sharp_books_used": []}
-        
-        # Get unique markets needed per sport
-        markets_by_sport = {}
-        for prop in all_props:
-            market = PROP_MAPPINGS.get(prop.stat_type)
-            if market:
-                if prop.sport not in markets_by_sport:
-                    markets_by_sport[prop.sport] = set()
-                markets_by_sport[prop.sport].add(market)
-        
-        # Fetch sharp odds for each sport and market (prioritizes DraftKings/FanDuel)
-        all_odds = []
-        for s in sports_to_fetch:
-            sport_markets = markets_by_sport.get(s.upper(), set())
-            for market in list(sport_markets)[:3]:  # Limit API calls per sport
-                odds = await fetch_sharp_odds(session, s, market)
-                all_odds.extend(odds)
-        
-        if not all_odds:
-            return {"count": 0, "plays": [], "sharp_books_used": [], "error": "Could not fetch sharp odds"}
-        
-        # Analyze each prop
-        ev_plays = []
-        
-        for prop in all_props:
-            market = PROP_MAPPINGS.get(prop.stat_type)
-            if not market:
+    session = app.state.session
+    # Determine which sports to fetch
+    sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
+
+    # Fetch from all platforms concurrently for all sports
+    tasks = []
+    for s in sports_to_fetch:
+        tasks.extend([
+            fetch_prizepicks(session, s),
+            fetch_underdog(session, s),
+            fetch_betr_picks(session, s),
+            fetch_chalkboard(session, s),
+        ])
+    results = await asyncio.gather(*tasks)
+
+    all_props = []
+    for props in results:
+        all_props.extend(props)
+
+    if platform:
+        all_props = [p for p in all_props if p.platform == platform.lower()]
+
+    if not all_props:
+        return {"count": 0, "plays": [], "sharp_books_used": []}
+
+    # Get unique markets needed per sport
+    markets_by_sport = {}
+    for prop in all_props:
+        market = _PROP_MAP_CI.get(prop.stat_type.lower())
+        if market:
+            if prop.sport not in markets_by_sport:
+                markets_by_sport[prop.sport] = set()
+            markets_by_sport[prop.sport].add(market)
+
+    # Fetch sharp odds for every sport/market pair concurrently; markets for
+    # the same sport share one cached events call (prioritizes DK/FanDuel)
+    odds_results = await asyncio.gather(*[
+        fetch_sharp_odds(session, s, market)
+        for s in sports_to_fetch
+        for market in list(markets_by_sport.get(s.upper(), set()))[:3]  # Limit API calls per sport
+    ])
+
+    all_odds = []
+    for odds in odds_results:
+        all_odds.extend(odds)
+
+    if not all_odds:
+        return {"count": 0, "plays": [], "sharp_books_used": [], "error": "Could not fetch sharp odds"}
+
+    # Phase 1: match each prop to its best odds row (no math yet)
+    matched: list[tuple[Prop, dict]] = []
+
+    for prop in all_props:
+        market = _PROP_MAP_CI.get(prop.stat_type.lower())
+        if not market:
+            continue
+
+        # Find matching odds - prefer sharp books
+        relevant_odds = [o for o in all_odds if o["market"] == market]
+        # Sort to prioritize sharp books
+        relevant_odds.sort(key=lambda x: 0 if x.get("is_sharp") else 1)
+
+        matched_name = match_player(prop.player_name, [o["player"] for o in relevant_odds])
+
+        if not matched_name:
+            continue
+
+        for odds in relevant_odds:
+            if odds["player"] != matched_name:
                 continue
-            
-            # Find matching odds - prefer sharp books
-            relevant_odds = [o for o in all_odds if o["market"] == market]
-            # Sort to prioritize sharp books
-            relevant_odds.sort(key=lambda x: 0 if x.get("is_sharp") else 1)
-            
-            matched_name = match_player(prop.player_name, [o["player"] for o in relevant_odds])
-            
-            if not matched_name:
+            if abs(odds["line"] - prop.line) > 0.5:
                 continue
-            
-            for odds in relevant_odds:
-                if odds["player"] != matched_name:
-                    continue
-                if abs(odds["line"] - prop.line) > 0.5:
-                    continue
-                
-                over_prob, under_prob = calculate_no_vig(odds["over_odds"], odds["under_odds"])
-                
-                if over_prob > under_prob:
-                    recommended = "OVER"
-                    win_prob = over_prob
-                else:
-                    recommended = "UNDER"
-                    win_prob = under_prob
-                
-                default_be = BREAKEVEN.get(prop.platform, {}).get("default", 54.34)
-                ev_pct = win_prob - default_be
-                
-                if win_prob >= min_win and ev_pct >= min_ev:
-                    ev_plays.append({
-                        "prop": prop.dict(),
-                        "sharp_odds": {
-                            "bookmaker": odds["bookmaker"],
-                            "line": odds["line"],
-                            "over_odds": odds["over_odds"],
-                            "under_odds": odds["under_odds"],
-                            "over_probability": round(over_prob, 2),
-                            "under_probability": round(under_prob, 2),
-                            "is_sharp": odds.get("is_sharp", False),
-                        },
-                        "recommended_play": recommended,
-                        "win_probability": round(win_prob, 2),
-                        "ev_percentage": round(ev_pct, 2),
-                        "best_for": get_best_slip_types(win_prob, prop.platform),
-                    })
-                break
-        
-        # Sort by EV
-        ev_plays.sort(key=lambda x: x["ev_percentage"], reverse=True)
-        
-        return {
-            "count": len(ev_plays),
-            "sport": "ALL" if sport.lower() == "all" else sport.upper(),
-            "sharp_books_used": list(set(p["sharp_odds"]["bookmaker"] for p in ev_plays)),
-            "plays": ev_plays
-        }
+            matched.append((prop, odds))
+            break
+
+    # Phase 2: lay the matched pairs out as SoA arrays — no-vig, win side, EV
+    # and the min_win/min_ev filter all run as vectorized passes, and only
+    # qualifying rows materialize response dicts.
+    ev_plays = []
+
+    if matched:
+        over_probs, under_probs = calculate_no_vig_vec(
+            [odds["over_odds"] for _, odds in matched],
+            [odds["under_odds"] for _, odds in matched],
+        )
+        win_probs = np.maximum(over_probs, under_probs)
+        over_wins = over_probs > under_probs
+        default_bes = np.array([
+            BREAKEVEN.get(prop.platform, {}).get("default", 54.34)
+            for prop, _ in matched
+        ])
+        ev_pcts = win_probs - default_bes
+        qualifies = (win_probs >= min_win) & (ev_pcts >= min_ev)
+
+        for idx in np.flatnonzero(qualifies):
+            prop, odds = matched[idx]
+            win_prob = float(win_probs[idx])
+
+            ev_plays.append({
+                "prop": prop.model_dump(),
+                "sharp_odds": {
+                    "bookmaker": odds["bookmaker"],
+                    "line": odds["line"],
+                    "over_odds": odds["over_odds"],
+                    "under_odds": odds["under_odds"],
+                    "over_probability": round(float(over_probs[idx]), 2),
+                    "under_probability": round(float(under_probs[idx]), 2),
+                    "is_sharp": odds.get("is_sharp", False),
+                },
+                "recommended_play": "OVER" if over_wins[idx] else "UNDER",
+                "win_probability": round(win_prob, 2),
+                "ev_percentage": round(float(ev_pcts[idx]), 2),
+                "best_for": get_best_slip_types(win_prob, prop.platform),
+            })
+
+    # Sort by EV
+    ev_plays.sort(key=lambda x: x["ev_percentage"], reverse=True)
+
+    return {
+        "count": len(ev_plays),
+        "sport": "ALL" if sport.lower() == "all" else sport.upper(),
+        "sharp_books_used": list(set(p["sharp_odds"]["bookmaker"] for p in ev_plays)),
+        "plays": ev_plays
+    }
 
 
 @app.get("/api/middles")
@@ -754,77 +1003,83 @@ async def get_middles(
     min_spread: float = Query(0.5, description="Minimum spread between lines"),
 ):
     """Find middle/arbitrage opportunities across platforms."""
-    async with aiohttp.ClientSession() as session:
-        # Determine which sports to fetch
-        sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
-        
-        # Fetch from all platforms for all sports
-        pp_props = []
-        ud_props = []
-        for s in sports_to_fetch:
-            pp_props.extend(await fetch_prizepicks(session, s))
-            ud_props.extend(await fetch_underdog(session, s))
-        
-        # Group props by player + stat + sport
-        def key(p):
-            return (p.player_name.lower().strip(), p.stat_type.lower(), p.sport.lower())
-        
-        pp_by_key = {key(p): p for p in pp_props}
-        ud_by_key = {key(p): p for p in ud_props}
-        
-        middles = []
-        
-        # Find matching props with different lines
-        for k, pp_prop in pp_by_key.items():
-            if k not in ud_by_key:
-                continue
-            
-            ud_prop = ud_by_key[k]
-            spread = abs(pp_prop.line - ud_prop.line)
-            
-            if spread >= min_spread:
-                # Determine which platform has higher/lower line
-                if pp_prop.line > ud_prop.line:
-                    high_platform = "prizepicks"
-                    low_platform = "underdog"
-                    high_line = pp_prop.line
-                    low_line = ud_prop.line
-                else:
-                    high_platform = "underdog"
-                    low_platform = "prizepicks"
-                    high_line = ud_prop.line
-                    low_line = pp_prop.line
-                
-                # Middle zone is between the lines
-                middle_zone = list(range(int(low_line) + 1, int(high_line) + 1))
-                if not middle_zone:
-                    middle_zone = [low_line + 0.5]
-                
-                middles.append({
-                    "player_name": pp_prop.player_name,
-                    "stat_type": pp_prop.stat_type,
-                    "sport": sport.upper(),
-                    "platform_a": {
-                        "name": high_platform,
-                        "line": high_line,
-                        "recommended": "UNDER",
-                    },
-                    "platform_b": {
-                        "name": low_platform,
-                        "line": low_line,
-                        "recommended": "OVER",
-                    },
-                    "spread": spread,
-                    "middle_zone": middle_zone,
-                })
-        
-        middles.sort(key=lambda x: x["spread"], reverse=True)
-        
-        return {
-            "count": len(middles),
-            "sport": sport.upper(),
-            "middles": middles
-        }
+    session = app.state.session
+    # Determine which sports to fetch
+    sports_to_fetch = MAIN_SPORTS if sport.lower() == "all" else [sport.lower()]
+
+    # Fetch both platforms for all sports concurrently
+    results = await asyncio.gather(
+        *[fetch_prizepicks(session, s) for s in sports_to_fetch],
+        *[fetch_underdog(session, s) for s in sports_to_fetch],
+    )
+
+    pp_props = []
+    ud_props = []
+    for props in results[:len(sports_to_fetch)]:
+        pp_props.extend(props)
+    for props in results[len(sports_to_fetch):]:
+        ud_props.extend(props)
+
+    # Group props by player + stat + sport
+    def key(p):
+        return (p.player_name.lower().strip(), p.stat_type.lower(), p.sport.lower())
+
+    pp_by_key = {key(p): p for p in pp_props}
+    ud_by_key = {key(p): p for p in ud_props}
+
+    middles = []
+
+    # Find matching props with different lines
+    for k, pp_prop in pp_by_key.items():
+        if k not in ud_by_key:
+            continue
+
+        ud_prop = ud_by_key[k]
+        spread = abs(pp_prop.line - ud_prop.line)
+
+        if spread >= min_spread:
+            # Determine which platform has higher/lower line
+            if pp_prop.line > ud_prop.line:
+                high_platform = "prizepicks"
+                low_platform = "underdog"
+                high_line = pp_prop.line
+                low_line = ud_prop.line
+            else:
+                high_platform = "underdog"
+                low_platform = "prizepicks"
+                high_line = ud_prop.line
+                low_line = pp_prop.line
+
+            # Middle zone is between the lines
+            middle_zone = list(range(int(low_line) + 1, int(high_line) + 1))
+            if not middle_zone:
+                middle_zone = [low_line + 0.5]
+
+            middles.append({
+                "player_name": pp_prop.player_name,
+                "stat_type": pp_prop.stat_type,
+                "sport": sport.upper(),
+                "platform_a": {
+                    "name": high_platform,
+                    "line": high_line,
+                    "recommended": "UNDER",
+                },
+                "platform_b": {
+                    "name": low_platform,
+                    "line": low_line,
+                    "recommended": "OVER",
+                },
+                "spread": spread,
+                "middle_zone": middle_zone,
+            })
+
+    middles.sort(key=lambda x: x["spread"], reverse=True)
+
+    return {
+        "count": len(middles),
+        "sport": sport.upper(),
+        "middles": middles
+    }
 
 
 @app.get("/api/compare/{player_name}")
@@ -833,33 +1088,35 @@ async def compare_player(
     sport: str = Query("nba", description="Sport"),
 ):
     """Compare a player's lines across all platforms."""
-    async with aiohttp.ClientSession() as session:
-        pp_props = await fetch_prizepicks(session, sport)
-        ud_props = await fetch_underdog(session, sport)
-        
-        all_props = pp_props + ud_props
-        
-        # Find matching player
-        matches = [p for p in all_props if fuzz.partial_ratio(player_name.lower(), p.player_name.lower()) >= 80]
-        
-        if not matches:
-            return {"found": False, "player": player_name, "props": []}
-        
-        # Group by stat type
-        by_stat = {}
-        for p in matches:
-            if p.stat_type not in by_stat:
-                by_stat[p.stat_type] = {}
-            by_stat[p.stat_type][p.platform] = p.line
-        
-        return {
-            "found": True,
-            "player": matches[0].player_name,
-            "team": matches[0].team,
-            "sport": sport.upper(),
-            "by_stat": by_stat,
-            "props": [p.dict() for p in matches]
-        }
+    session = app.state.session
+    pp_props, ud_props = await asyncio.gather(
+        fetch_prizepicks(session, sport),
+        fetch_underdog(session, sport),
+    )
+
+    all_props = pp_props + ud_props
+
+    # Find matching player
+    matches = [p for p in all_props if fuzz.partial_ratio(player_name.lower(), p.player_name.lower()) >= 80]
+
+    if not matches:
+        return {"found": False, "player": player_name, "props": []}
+
+    # Group by stat type
+    by_stat = {}
+    for p in matches:
+        if p.stat_type not in by_stat:
+            by_stat[p.stat_type] = {}
+        by_stat[p.stat_type][p.platform] = p.line
+
+    return {
+        "found": True,
+        "player": matches[0].player_name,
+        "team": matches[0].team,
+        "sport": sport.upper(),
+        "by_stat": by_stat,
+        "props": [p.model_dump() for p in matches]
+    }
 
 
 @app.get("/api/games")
@@ -867,43 +1124,46 @@ async def get_games(
     sport: Optional[str] = Query(None, description="Sport (nba, nfl, mlb, nhl) or omit for all"),
 ):
     """Get today's games with prop counts (simplified for now)."""
-    async with aiohttp.ClientSession() as session:
-        # If no sport specified or "all", fetch from all sports
-        if not sport or sport.lower() == "all":
-            sports_to_fetch = ["nba", "nfl", "mlb", "nhl"]
-        else:
-            sports_to_fetch = [sport.lower()]
-        
-        all_pp_props = []
-        all_ud_props = []
-        teams = set()
-        
-        for s in sports_to_fetch:
-            pp_props = await fetch_prizepicks(session, s)
-            ud_props = await fetch_underdog(session, s)
-            all_pp_props.extend(pp_props)
-            all_ud_props.extend(ud_props)
-            
-            for p in pp_props + ud_props:
-                if p.team:
-                    teams.add(f"{p.team} ({s.upper()})" if len(sports_to_fetch) > 1 else p.team)
-        
-        return {
-            "sport": "ALL" if len(sports_to_fetch) > 1 else sports_to_fetch[0].upper(),
-            "teams_with_props": sorted(list(teams)),
-            "total_props": len(all_pp_props) + len(all_ud_props),
-            "platforms": {
-                "prizepicks": len(all_pp_props),
-                "underdog": len(all_ud_props),
-            }
+    session = app.state.session
+    # If no sport specified or "all", fetch from all sports
+    if not sport or sport.lower() == "all":
+        sports_to_fetch = ["nba", "nfl", "mlb", "nhl"]
+    else:
+        sports_to_fetch = [sport.lower()]
+
+    all_pp_props = []
+    all_ud_props = []
+    teams = set()
+
+    results = await asyncio.gather(*[
+        asyncio.gather(fetch_prizepicks(session, s), fetch_underdog(session, s))
+        for s in sports_to_fetch
+    ])
+
+    for s, (pp_props, ud_props) in zip(sports_to_fetch, results):
+        all_pp_props.extend(pp_props)
+        all_ud_props.extend(ud_props)
+
+        for p in pp_props + ud_props:
+            if p.team:
+                teams.add(f"{p.team} ({s.upper()})" if len(sports_to_fetch) > 1 else p.team)
+
+    return {
+        "sport": "ALL" if len(sports_to_fetch) > 1 else sports_to_fetch[0].upper(),
+        "teams_with_props": sorted(list(teams)),
+        "total_props": len(all_pp_props) + len(all_ud_props),
+        "platforms": {
+            "prizepicks": len(all_pp_props),
+            "underdog": len(all_ud_props),
         }
+    }
 
 
 @app.post("/api/calc")
 async def calculate_ev(over_odds: int, under_odds: int):
     """Calculate no-vig probabilities from odds."""
     over_prob, under_prob = calculate_no_vig(over_odds, under_odds)
-    
+
     return {
         "over_odds": over_odds,
         "under_odds": under_odds,
@@ -931,4 +1191,6 @@ async def calculate_ev(over_odds: int, under_odds: int):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # libuv event loop + C HTTP parser: everything here is small-await async
+    # I/O, which is exactly where uvloop's scheduling overhead wins show up.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
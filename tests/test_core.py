@@ -8,10 +8,13 @@ from automation import PaperPolicy, build_paper_entries
 from api import (
     DataCache,
     Prop,
+    app,
     build_consensus,
+    cache,
     calculate_entry_ev,
     canonical_market_key,
     fetch_dfs_props_from_odds_api,
+    get_props,
 )
 from storage import PipelineStore
 
@@ -110,6 +113,20 @@ class CacheTests(unittest.TestCase):
         self.assertEqual(cache.get("key"), (None, False))
         self.assertEqual(cache.get("key", allow_stale=True), ({"value": 1}, False))
 
+    def test_full_cache_evicts_least_recently_used_entry(self):
+        cache = DataCache(default_ttl=60, maxsize=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")  # a read refreshes recency
+        cache.set("d", 4)  # evicts "b", the least recently used
+
+        self.assertEqual(cache.get("b"), (None, False))
+        self.assertEqual(cache.get("a"), (1, True))
+        self.assertEqual(cache.get("c"), (3, True))
+        self.assertEqual(cache.get("d"), (4, True))
+        self.assertEqual(len(cache.cache), 3)
+
 
 class PaperEntryTests(unittest.TestCase):
     def test_excellent_entry_is_created_after_stable_observations(self):
@@ -261,6 +278,65 @@ class StorageTests(unittest.TestCase):
             self.assertIsNone(leg["probability_clv"])
 
 
+class PropsPaginationTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.props = [
+            Prop(
+                id=f"prop-{index}",
+                player_name=f"Player {index}",
+                team="AAA",
+                sport="NBA",
+                stat_type="Points",
+                platform="prizepicks",
+                line=10.5 + index,
+            )
+            for index in range(5)
+        ]
+        app.state.session = object()
+        cache.set("props_nba", self.props, ttl=60)
+        self.addCleanup(cache.invalidate, "props_nba")
+        self.addCleanup(cache.invalidate, "props_dump_nba")
+
+    async def fetch_page(self, **overrides):
+        params = {
+            "request": None,
+            "sport": "nba",
+            "platform": None,
+            "stat": None,
+            "min_ev": None,
+            "player": None,
+            "limit": None,
+            "offset": 0,
+            "refresh": False,
+            "x_admin_key": None,
+            "x_hermes_key": None,
+        }
+        params.update(overrides)
+        return await get_props(**params)
+
+    async def test_default_page_returns_everything(self):
+        payload = await self.fetch_page()
+        self.assertEqual(payload["count"], 5)
+        self.assertEqual(payload["total"], 5)
+        self.assertEqual(payload["offset"], 0)
+        self.assertEqual(len(payload["props"]), 5)
+
+    async def test_limit_and_offset_slice_the_board(self):
+        payload = await self.fetch_page(limit=2, offset=1)
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(payload["total"], 5)
+        self.assertEqual(payload["offset"], 1)
+        self.assertEqual(
+            [prop["id"] for prop in payload["props"]], ["prop-1", "prop-2"]
+        )
+
+    async def test_offset_past_the_end_returns_empty_page(self):
+        payload = await self.fetch_page(limit=2, offset=10)
+        self.assertEqual(payload["count"], 0)
+        self.assertEqual(payload["total"], 5)
+        self.assertEqual(payload["props"], [])
+
+
 class PrizePicksIngestionTests(unittest.IsolatedAsyncioTestCase):
     async def test_discovers_supported_markets_before_odds_request(self):
         event = {